@@ -0,0 +1,131 @@
+"""
+Shared helpers for the archive scripts that create mapping and sample input files
+"""
+
+import argparse
+import csv
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.dataframe import dataframe_to_rows
+
+
+BASE_DATE = pd.Timestamp("2023-01-01")
+FLAG_COLUMNS = ['smoke_alarm', 'fire_extinguisher', 'fire_blanket', 'sprinkler_system', 'fire_hydrant']
+
+
+def parse_format_arg(description):
+    """Parse the --format option shared by the mapping file scripts (csv by default)"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--format", choices=("csv", "xlsx"), default="csv",
+                        help="Output format for the mapping file (default: csv)")
+    return parser.parse_args().format
+
+
+def write_mapping_workbook(mapping_data, headers, path, sheet_name="column mapping"):
+    """Write mapping rows to an xlsx file using openpyxl write-only mode"""
+    wb = Workbook(write_only=True)
+    worksheet = wb.create_sheet(sheet_name)
+
+    # Auto-adjust column widths (must be set before any rows are appended)
+    columns = list(zip(*([headers] + mapping_data)))
+    widths = [min(max(len(str(value)) for value in column) + 2, 50) for column in columns]
+    for col_idx, width in enumerate(widths, 1):
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+    worksheet.append(headers)
+    for row in mapping_data:
+        worksheet.append(row)
+    wb.save(path)
+
+
+def write_excel(path, df):
+    """Write a DataFrame to a single-sheet xlsx file using openpyxl write-only mode"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    for row in dataframe_to_rows(df, index=False, header=True):
+        ws.append(row)
+    wb.save(path)
+
+
+def write_csv(path, headers, rows):
+    """Write a header row followed by the given data rows to a CSV file"""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def generate_sample_df(n, include_flags=False, seed=None):
+    """Generate sample insurance data
+
+    With include_flags the fire protection factor is replaced by the five 0/1
+    FLAG_COLUMNS used to demonstrate LIST mappings; otherwise some optional
+    fields are randomly blanked for realism.
+    """
+    # Insurance-related data generators
+    cities = ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide", "Canberra"]
+    states = ["NSW", "VIC", "QLD", "WA", "SA", "ACT"]
+    construction_types = ["Brick", "Concrete", "Timber", "Steel Frame", "Mixed"]
+    fire_protection = ["Sprinkler System", "Fire Alarm", "Hydrant System", "None", "Combined"]
+    occupancy_types = ["Commercial", "Residential", "Industrial", "Mixed Use", "Warehouse"]
+    risk_categories = ["Low", "Medium", "High", "Very High"]
+    coverage_types = ["Fire", "Comprehensive", "Business Interruption", "Property Damage"]
+    policy_statuses = ["Active", "Inactive", "Pending", "Cancelled"]
+
+    if include_flags:
+        cities, states = cities[:5], states[:5]
+
+    rng = np.random.default_rng(seed)
+    policy_offset = 2000 if include_flags else 1000
+
+    # Generate random dates
+    inception_dates = BASE_DATE + pd.to_timedelta(rng.integers(0, 366, n), unit="D")
+    expiry_dates = inception_dates + pd.Timedelta(days=365)
+
+    building_construction_type = rng.choice(construction_types, n).astype(object)
+    building_age = rng.integers(1, 101, n).astype(object)
+
+    data = {
+        "policy_number": [f"POL{policy_offset + i:04d}" for i in range(n)],
+        "inception_date": inception_dates.strftime("%Y-%m-%d"),
+        "expiry_date": expiry_dates.strftime("%Y-%m-%d"),
+        "insured_name": [f"Customer {i+1} Pty Ltd" for i in range(n)],
+        "premium_amount": rng.uniform(1000, 50000, n).round(2),
+        "sum_insured": rng.uniform(100000, 5000000, n).round(2),
+    }
+
+    if include_flags:
+        # Generate all fire protection flags in one draw, one column per flag
+        flags = rng.integers(0, 2, size=(n, len(FLAG_COLUMNS)), dtype=np.uint8)
+        data.update(zip(FLAG_COLUMNS, flags.T))
+        data["building_construction_type"] = building_construction_type
+    else:
+        fire_protection_factor = rng.choice(fire_protection, n).astype(object)
+
+        # Make some optional fields empty for realism
+        building_construction_type[rng.random(n) < 0.2] = ""  # 20% chance to be missing
+        fire_protection_factor[rng.random(n) < 0.3] = ""  # 30% chance to be missing
+        building_age[rng.random(n) < 0.1] = ""  # 10% chance to be missing
+
+        data["building_construction_type"] = building_construction_type
+        data["fire_protection_factor"] = fire_protection_factor
+
+    data.update({
+        "occupancy_type": rng.choice(occupancy_types, n),
+        "building_age": building_age,
+        "number_of_floors": rng.integers(1, 21, n),
+        "building_area_sqft": rng.uniform(1000, 50000, n).round(2),
+        "location_city": rng.choice(cities, n),
+        "location_state": rng.choice(states, n),
+        "risk_category": rng.choice(risk_categories, n),
+        "deductible_amount": rng.uniform(1000, 50000, n).round(2),
+        "coverage_type": rng.choice(coverage_types, n),
+        "policy_status": rng.choice(policy_statuses, n),
+        "agent_code": [f"AGT{code}" for code in rng.integers(100, 1000, n)],
+        "underwriting_year": rng.integers(2020, 2025, n)
+    })
+
+    return pd.DataFrame(data)
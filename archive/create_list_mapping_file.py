@@ -4,10 +4,12 @@ Script to create a mapping file that demonstrates LIST data type functionality
 for fire protection factors
 """
 
-import pandas as pd
+import os
 
+from _common import parse_format_arg, write_csv, write_mapping_workbook
 
-def create_list_mapping_file():
+
+def create_list_mapping_file(output_format="csv"):
     """Create mapping file with LIST data type example"""
     
     # Define the mapping data including LIST type for fire protection factors
@@ -42,36 +44,17 @@ def create_list_mapping_file():
         ["underwriting_year", "UNDERWRITING_YEAR", "INTEGER", "YES"]
     ]
     
-    # Create DataFrame
-    df = pd.DataFrame(mapping_data, columns=[
-        "Original Column", 
-        "New Column", 
-        "Data Type", 
-        "Optional"
-    ])
+    headers = ("Original Column", "New Column", "Data Type", "Optional")
     
     # Create directory if it doesn't exist
-    import os
     os.makedirs("mapping", exist_ok=True)
     
-    # Save to Excel file
-    output_path = "mapping/column_mapping_list.xlsx"
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name="column mapping", index=False)
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets["column mapping"]
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+    # Save as CSV unless the Excel workbook is explicitly requested
+    output_path = f"mapping/column_mapping_list.{output_format}"
+    if output_format == "xlsx":
+        write_mapping_workbook(mapping_data, headers, output_path)
+    else:
+        write_csv(output_path, headers, mapping_data)
     
     print(f"LIST mapping file created successfully: {output_path}")
     print(f"Total mappings: {len(mapping_data)}")
@@ -82,4 +65,4 @@ def create_list_mapping_file():
 
 
 if __name__ == "__main__":
-    create_list_mapping_file()
+    create_list_mapping_file(parse_format_arg(__doc__))
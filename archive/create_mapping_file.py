@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """
-Script to create the column mapping Excel file for insurance data conversion
+Script to create the column mapping file (CSV, or XLSX with --format xlsx) for insurance data conversion
 """
 
-import pandas as pd
+import os
 
+from _common import parse_format_arg, write_csv, write_mapping_workbook
 
-def create_mapping_file():
-    """Create the column mapping Excel file"""
+
+def create_mapping_file(output_format="csv"):
+    """Create the column mapping file"""
     
     # Define the mapping data for insurance company data
     mapping_data = [
@@ -34,36 +36,17 @@ def create_mapping_file():
         ["underwriting_year", "UNDERWRITING_YEAR", "INTEGER", "YES"]
     ]
     
-    # Create DataFrame
-    df = pd.DataFrame(mapping_data, columns=[
-        "Original Column", 
-        "New Column", 
-        "Data Type", 
-        "Optional"
-    ])
+    headers = ("Original Column", "New Column", "Data Type", "Optional")
     
     # Create directory if it doesn't exist
-    import os
     os.makedirs("mapping", exist_ok=True)
     
-    # Save to Excel file
-    output_path = "mapping/column_mapping.xlsx"
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name="column mapping", index=False)
-        
-        # Auto-adjust column widths
-        worksheet = writer.sheets["column mapping"]
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+    # Save as CSV unless the Excel workbook is explicitly requested
+    output_path = f"mapping/column_mapping.{output_format}"
+    if output_format == "xlsx":
+        write_mapping_workbook(mapping_data, headers, output_path)
+    else:
+        write_csv(output_path, headers, mapping_data)
     
     print(f"Mapping file created successfully: {output_path}")
     print(f"Total mappings: {len(mapping_data)}")
@@ -73,4 +56,4 @@ def create_mapping_file():
 
 
 if __name__ == "__main__":
-    create_mapping_file()
+    create_mapping_file(parse_format_arg(__doc__))
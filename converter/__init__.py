@@ -0,0 +1,3 @@
+"""
+Modular data conversion tool
+"""
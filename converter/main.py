@@ -2,25 +2,24 @@
 Main module for modular data conversion tool using Pandas
 """
 
+import argparse
 import sys
 import os
 import logging
 from typing import Dict
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from .src.config_loader import ConverterConfigLoader
-from .src.mapping_processor import MappingProcessor
-from .src.data_loader import DataLoader
-from .src.data_converter import DataConverter
-from .src.output_generator import OutputGenerator
-
 
 class ModularDataConverter:
     """Main class that orchestrates the modular data conversion process"""
     
     def __init__(self, config_path: str = "config_data_conversion.yaml"):
+        # Imported here so CLI argument handling does not pay for pandas/openpyxl
+        from .src.config_loader import ConverterConfigLoader
+        from .src.mapping_processor import MappingProcessor
+        from .src.data_loader import DataLoader
+        from .src.data_converter import DataConverter
+        from .src.output_generator import OutputGenerator
+        
         self.config_path = config_path
         self.logger = self._setup_logging()
         self.config_loader = ConverterConfigLoader(config_path)
@@ -31,70 +30,92 @@ class ModularDataConverter:
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('conversion.log')
-            ]
-        )
+        # basicConfig is a no-op once the root logger has handlers; make that explicit
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.StreamHandler(sys.stdout),
+                    logging.FileHandler('conversion.log', delay=True)
+                ]
+            )
         return logging.getLogger(__name__)
     
+    def _check_io_paths(self, input_file_path: str, output_file_path: str) -> None:
+        """Fail fast on a missing input file or an unwritable output directory"""
+        if not input_file_path:
+            raise ValueError("Input file path not specified in configuration")
+        if not os.path.exists(input_file_path):
+            raise FileNotFoundError(f"Input file not found: {input_file_path}")
+        
+        if not output_file_path:
+            raise ValueError("Output file path not specified in configuration")
+        # A missing output directory is created on save; only an existing one must be writable
+        output_dir = os.path.dirname(os.path.abspath(output_file_path))
+        if os.path.isdir(output_dir) and not os.access(output_dir, os.W_OK):
+            raise PermissionError(f"Output directory is not writable: {output_dir}")
+    
     def convert(self) -> bool:
         """Execute the complete modular data conversion process"""
         try:
             self.logger.info("Starting modular data conversion process")
             
-            # Step 1: Load and process mapping rules
-            mapping_result = self.mapping_processor.process_mapping()
-            column_mapping = mapping_result['column_mapping']
-            
-            # Step 2: Load input configuration
+            # Step 1: Validate input/output locations before any Excel parsing
             input_config = self.config_loader.get_input_config()
             input_file_path = input_config.get('file_path')
             input_file_type = input_config.get('file_type', 'auto')
+            output_config = self.config_loader.get_output_config()
+            self._check_io_paths(input_file_path, output_config.get('file_path'))
             
-            if not input_file_path:
-                raise ValueError("Input file path not specified in configuration")
+            self.logger.info("Input file: %s (%s)", input_file_path, input_file_type)
             
-            self.logger.info(f"Input file: {input_file_path} ({input_file_type})")
+            # Step 2: Load and process mapping rules
+            mapping_result = self.mapping_processor.process_mapping()
+            column_mapping = mapping_result['column_mapping']
             
             # Step 3: Load input data
             input_df = self.data_loader.load_input_data(input_file_path, input_file_type)
-            self.logger.info(f"Loaded {len(input_df)} rows with {len(input_df.columns)} columns")
+            self.logger.info("Loaded %d rows with %d columns", len(input_df), len(input_df.columns))
             
             # Step 4: Validate input data
             self.data_loader.validate_input_data(input_df, column_mapping)
             
             # Step 5: Convert data types
-            converted_df = self.data_converter.convert_data_types(input_df, column_mapping, mapping_result.get('value_mappings', {}))
-            self.logger.info(f"Converted to {len(converted_df)} rows with {len(converted_df.columns)} columns")
+            converted_df = self.data_converter.convert_data_types_parallel(input_df, column_mapping, mapping_result.get('value_mappings', {}))
+            self.logger.info("Converted to %d rows with %d columns", len(converted_df), len(converted_df.columns))
             
             # Step 6: Process LIST columns
             converted_df = self.data_converter.process_list_columns(converted_df, column_mapping)
             
             # Step 7: Generate output
-            output_config = self.config_loader.get_output_config()
-            self.logger.info(f"Output file: {output_config.get('file_path')} ({output_config.get('file_type', 'csv')})")
+            self.logger.info("Output file: %s (%s)", output_config.get('file_path'), output_config.get('file_type', 'csv'))
             self.output_generator.generate_output(converted_df)
             
             self.logger.info("Modular data conversion completed successfully")
             return True
             
-        except Exception as e:
-            self.logger.error(f"Modular data conversion failed: {e}")
+        except (FileNotFoundError, PermissionError, ValueError):
+            # Expected configuration, IO and data problems
+            self.logger.exception("Modular data conversion failed")
             return False
+        except Exception:
+            self.logger.exception("Unexpected error during modular data conversion")
+            raise
 
 
 def main():
     """Main function for modular data conversion tool"""
-    if len(sys.argv) > 1:
-        config_path = sys.argv[1]
-    else:
-        config_path = "config_data_conversion.yaml"
+    parser = argparse.ArgumentParser(description="Modular data conversion tool")
+    parser.add_argument(
+        "config_path",
+        nargs="?",
+        default="config_data_conversion.yaml",
+        help="Path to the conversion YAML config (default: config_data_conversion.yaml)"
+    )
+    args = parser.parse_args()
     
-    converter = ModularDataConverter(config_path)
+    converter = ModularDataConverter(args.config_path)
     success = converter.convert()
     
     if success:
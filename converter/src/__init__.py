@@ -0,0 +1,3 @@
+"""
+Conversion pipeline modules: config loading, mapping, loading, conversion and output
+"""
@@ -0,0 +1,56 @@
+"""
+Column matching helpers shared by the data loader and data converter
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Tuple
+
+import pandas as pd
+
+
+def _normalize(names: pd.Index) -> pd.Index:
+    """Normalize column names for case-insensitive, space/underscore-insensitive matching"""
+    return names.astype(str).str.lower().str.replace('_', ' ').str.strip()
+
+
+@lru_cache(maxsize=8)
+def _column_index(columns: Tuple) -> Tuple[pd.Index, pd.Index, pd.Index]:
+    """Build unique exact and normalized name indexes for a set of input columns"""
+    actual = pd.Index(columns, dtype=object)
+    exact = actual[~actual.duplicated()]
+    # Keep the first input column for each normalized name
+    normalized = _normalize(actual)
+    first = ~normalized.duplicated()
+    return exact, normalized[first], actual[first]
+
+
+def resolve_columns(target_cols: Iterable[str], columns) -> Dict[str, str]:
+    """Resolve mapping column names to actual input column names in one batch
+
+    Exact names take precedence over case-insensitive, space/underscore
+    variations; targets without a match resolve to None. The indexes for a
+    column set are cached, so validating and then converting the same input
+    frame normalizes its column names only once.
+    """
+    exact, normalized, normalized_actual = _column_index(tuple(columns))
+    targets = pd.Index(list(target_cols), dtype=object)
+    exact_positions = exact.get_indexer(targets)
+    normalized_positions = normalized.get_indexer(_normalize(targets))
+
+    resolved = {}
+    for target_col, exact_pos, normalized_pos in zip(targets, exact_positions, normalized_positions):
+        if exact_pos >= 0:
+            resolved[target_col] = exact[exact_pos]
+        elif normalized_pos >= 0:
+            resolved[target_col] = normalized_actual[normalized_pos]
+        else:
+            resolved[target_col] = None
+    return resolved
+
+
+def group_mappings(column_mapping: Dict[str, Dict[str, Any]]) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+    """Group mappings by new column name to handle list columns"""
+    grouped_mappings = {}
+    for original_col, mapping_info in column_mapping.items():
+        grouped_mappings.setdefault(mapping_info['new_column'], []).append((original_col, mapping_info))
+    return grouped_mappings
@@ -4,8 +4,21 @@ Configuration loader for data conversion tool
 
 import yaml
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML config file; cached per (path, mtime) so edits invalidate it"""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
 
 class ConverterConfigLoader:
     """Loads and validates configuration for data conversion"""
@@ -13,27 +26,31 @@ class ConverterConfigLoader:
     def __init__(self, config_path: str = "config_data_conversion.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
+        # Resolve each section once so getters are plain attribute reads
+        self.input_config = self.config.get('input', {})
+        self.output_config = self.config.get('output', {})
+        self.mapping_config = self.config.get('mapping', {})
+        self.processing_config = self.config.get('processing', {})
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return _parse_config_file(self.config_path, os.path.getmtime(self.config_path))
     
     def get_input_config(self) -> Dict[str, Any]:
         """Get input configuration"""
-        return self.config.get('input', {})
+        return self.input_config
     
     def get_output_config(self) -> Dict[str, Any]:
         """Get output configuration"""
-        return self.config.get('output', {})
+        return self.output_config
     
     def get_mapping_config(self) -> Dict[str, Any]:
         """Get mapping configuration"""
-        return self.config.get('mapping', {})
+        return self.mapping_config
     
     def get_processing_config(self) -> Dict[str, Any]:
         """Get processing configuration"""
-        return self.config.get('processing', {})
+        return self.processing_config
@@ -2,9 +2,47 @@
 Data converter module for data conversion tool using Pandas
 """
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+
+from .column_matching import group_mappings, resolve_columns
+
+
+# Fast path for CODE values: ASCII uppercase letters, digits and spaces
+_CODE_RE = re.compile(r'[A-Z0-9\s]*')
+
+
+def _is_code_value(value_str: str) -> bool:
+    """Check that all characters are uppercase letters, numbers, or spaces (Unicode included)"""
+    if _CODE_RE.fullmatch(value_str):
+        return True
+    return all(c.isupper() or c.isdigit() or c.isspace() for c in value_str)
+
+
+def _first_out_of_range(values: np.ndarray, limit: float) -> int:
+    """Return the position of the first value whose magnitude reaches limit, or -1 (NaN never does)"""
+    if values.size == 0:
+        return -1
+    too_big = np.abs(values) >= limit
+    first = int(too_big.argmax())
+    return first if too_big[first] else -1
+
+
+def _blank_additional_rows(col_data: pd.Series, first_rows) -> pd.Series:
+    """Set a column to NaN outside the first exploded row of each record
+    
+    Nullable integer and boolean columns go through object values, so they end up with
+    the float (or object, if they already held NA) dtype that rebuilding the exploded
+    rows one by one gave, and are written as e.g. 92.0 like before.
+    """
+    if pd.api.types.is_extension_array_dtype(col_data.dtype) and col_data.dtype.kind in 'iub':
+        return col_data.astype(object).where(first_rows, np.nan).infer_objects()
+    return col_data.where(first_rows)
 
 
 class DataConverter:
@@ -12,6 +50,13 @@ class DataConverter:
     
     def __init__(self, config_loader):
         self.config_loader = config_loader
+        # Column converters by mapping data type
+        self._converters = {
+            'CODE': self._convert_code,
+            'INTEGE': self._convert_intege,
+            'DECIMA': self._convert_decima,
+            'DATE': self._convert_date_vectorized,
+        }
     
     def _validate_code(self, value: str) -> str:
         """Validate CODE type: all capital letters, max 12 chars including spaces"""
@@ -21,7 +66,7 @@ class DataConverter:
         value_str = str(value).strip()
         
         # Check if all characters are uppercase letters, numbers, or spaces
-        if not all(c.isupper() or c.isdigit() or c.isspace() for c in value_str):
+        if not _is_code_value(value_str):
             raise ValueError(f"CODE value must be all uppercase letters and numbers: '{value_str}'")
         
         # Check length
@@ -30,6 +75,30 @@ class DataConverter:
         
         return value_str
     
+    def _validate_code_vectorized(self, col_data: pd.Series) -> pd.Series:
+        """Validate a whole CODE column at once: all capital letters, max 12 chars including spaces"""
+        mask_na = col_data.isna()
+        values = col_data.astype(str).str.strip()
+        
+        # Check that all characters are uppercase letters, numbers, or spaces
+        bad_chars = (~values.str.fullmatch(_CODE_RE) & ~mask_na).to_numpy(dtype=bool)
+        if bad_chars.any():
+            # The regex only covers ASCII, so re-check the distinct values it rejects
+            rejected = values[bad_chars]
+            is_code = {v: _is_code_value(v) for v in rejected.unique()}
+            bad_chars[bad_chars] = ~rejected.map(is_code).to_numpy(dtype=bool)
+        if bad_chars.any():
+            value_str = values[bad_chars].iloc[0]
+            raise ValueError(f"CODE value must be all uppercase letters and numbers: '{value_str}'")
+        
+        # Check length
+        too_long = (values.str.len() > 12) & ~mask_na
+        if too_long.any():
+            value_str = values[too_long].iloc[0]
+            raise ValueError(f"CODE value exceeds 12 characters: '{value_str}' ({len(value_str)} chars)")
+        
+        return values.where(~mask_na, col_data)
+    
     def _validate_intege(self, value) -> int:
         """Validate INTEGE type: max 12 digits, raise error if longer"""
         if pd.isna(value):
@@ -48,6 +117,25 @@ class DataConverter:
         
         return int_value
     
+    def _validate_intege_vectorized(self, col_data: pd.Series) -> pd.Series:
+        """Validate a whole INTEGE column at once: max 12 digits, raise error if longer"""
+        nums = pd.to_numeric(col_data, errors='coerce')
+        
+        # Values that were present but could not be parsed as numbers
+        invalid_parse = col_data.notna() & nums.isna()
+        if invalid_parse.any():
+            raise ValueError(f"INTEGE value must be a valid number: '{col_data[invalid_parse].iloc[0]}'")
+        
+        # Truncate towards zero like int(float(value)), then check digit length
+        values = np.trunc(nums.to_numpy(dtype='float64', na_value=np.nan))
+        first_too_big = _first_out_of_range(values, 10**12)
+        if first_too_big >= 0:
+            int_value = f"{values[first_too_big]:.0f}"
+            digit_length = len(int_value.lstrip('-'))
+            raise ValueError(f"INTEGE value exceeds 12 digits: '{int_value}' ({digit_length} digits)")
+        
+        return pd.Series(values, index=col_data.index).astype('Int64')
+    
     def _validate_decima(self, value) -> float:
         """Validate DECIMA type: max 12 total digits, max 4 decimal places"""
         if pd.isna(value):
@@ -69,6 +157,26 @@ class DataConverter:
         
         return float_value
     
+    def _validate_decima_vectorized(self, col_data: pd.Series) -> pd.Series:
+        """Validate a whole DECIMA column at once: max 12 total digits, max 4 decimal places
+        
+        Values the vectorized path cannot decide exactly are passed to _validate_decima,
+        so the results and errors are the same as validating every value one by one.
+        """
+        nums = pd.to_numeric(col_data, errors='coerce').astype('float64')
+        float_values = np.round(nums, 4)
+        
+        # np.round scales by 10**4 before rounding, so a value whose scaled form lies within
+        # float error of a half-way point may round the other way from round(); below 10**7 a
+        # value rounded to 4 places has at most 11 digits, so only larger ones need counting
+        scaled = nums * 10**4
+        near_tie = (scaled - np.floor(scaled) - 0.5).abs() <= 1e-6 + 4 * np.spacing(scaled.abs())
+        undecided = (col_data.notna() & nums.isna()) | near_tie | (nums.abs() >= 10**7)
+        if undecided.any():
+            float_values[undecided] = col_data[undecided].map(self._validate_decima).astype('float64')
+        
+        return float_values
+    
     def _convert_date(self, value) -> str:
         """Convert DATE type: convert to 'dd/mm/yyyy' format"""
         if pd.isna(value):
@@ -106,232 +214,276 @@ class DataConverter:
         
         raise ValueError(f"DATE value cannot be converted: '{value}'")
     
+    def _convert_date_vectorized(self, col_data: pd.Series, validate: bool = True) -> pd.Series:
+        """Convert a whole DATE column at once to 'dd/mm/yyyy' format"""
+        result = col_data.astype(object).copy()
+        values = col_data[col_data.notna()]
+        is_str = values.apply(isinstance, args=(str,))
+        str_values = values[is_str].astype(str)
+        
+        # Strings already in d/m/y form are only re-padded
+        is_dmy = str_values.str.count('/') == 2
+        parts = str_values[is_dmy].str.split('/', expand=True)
+        if not parts.empty:
+            result[parts.index] = parts[0].str.zfill(2) + '/' + parts[1].str.zfill(2) + '/' + parts[2].str.zfill(4)
+        
+        # Other strings go through pandas date parsing, each in its own format
+        parsed = pd.to_datetime(str_values[~is_dmy], errors='coerce', format='mixed')
+        
+        # Anything left is treated as an Excel date serial number (day 0 = 1899-12-30)
+        remaining = values.index.difference(parts.index).difference(parsed.index[parsed.notna()])
+        serials = pd.to_numeric(values[remaining], errors='coerce')
+        if serials.isna().any():
+            raise ValueError(f"DATE value cannot be converted: '{values[remaining][serials.isna()].iloc[0]}'")
+        serial_dates = pd.Timestamp('1899-12-30') + pd.to_timedelta(serials.astype('float64'), unit='D')
+        
+        for dates in (parsed.dropna(), serial_dates):
+            if not dates.empty:
+                result[dates.index] = dates.dt.strftime('%d/%m/%Y')
+        return result
+    
+    def _convert_code(self, col_data: pd.Series, validate: bool = True) -> pd.Series:
+        """Convert a CODE column, stored as categories since CODE values have low cardinality"""
+        if validate:
+            converted_data = self._validate_code_vectorized(col_data)
+        else:
+            converted_data = col_data.astype(str).replace('nan', np.nan)
+        return converted_data.astype('category')
+    
+    def _convert_intege(self, col_data: pd.Series, validate: bool = True) -> pd.Series:
+        """Convert an INTEGE column to nullable integers"""
+        if validate:
+            return self._validate_intege_vectorized(col_data)
+        return pd.to_numeric(col_data, errors='coerce').astype('Int64')
+    
+    def _convert_decima(self, col_data: pd.Series, validate: bool = True) -> pd.Series:
+        """Convert a DECIMA column to floats"""
+        if validate:
+            return self._validate_decima_vectorized(col_data)
+        return pd.to_numeric(col_data, errors='coerce').astype('float64')
+    
+    def _convert_flag_value(self, flag_value, data_type: str):
+        """Convert a single flag value to the appropriate data type"""
+        if data_type == 'CODE':
+            # For CODE type, just use the flag value (0 or 1) as string
+            return str(int(flag_value))
+        elif data_type == 'INTEGE':
+            return int(flag_value)
+        elif data_type == 'DECIMA':
+            return float(flag_value)
+        elif data_type == 'DATE':
+            return self._convert_date(flag_value)
+        return flag_value
+    
+    def _convert_flag_column(self, col_series: pd.Series, data_type: str) -> pd.Series:
+        """Convert the non-missing values of one flag column, dropping values that fail validation"""
+        values = col_series.dropna()
+        
+        # Numeric flag columns are converted column-wise
+        if data_type in ('CODE', 'INTEGE', 'DECIMA') and pd.api.types.is_numeric_dtype(values):
+            values = values.astype('float64')
+            if data_type == 'DECIMA':
+                return values.astype(object)
+            finite = np.isfinite(values)
+            for flag_value in values[~finite]:
+                print(f"Warning: Value '{flag_value}' failed validation for data type {data_type}: cannot convert to integer")
+            ints = np.trunc(values[finite]).astype('int64')
+            return ints.astype(str).astype(object) if data_type == 'CODE' else ints.astype(object)
+        
+        converted = {}
+        # Iterate raw numpy values rather than going through pandas scalar access
+        for idx, flag_value in zip(values.index, values.to_numpy()):
+            try:
+                converted[idx] = self._convert_flag_value(flag_value, data_type)
+            except Exception as e:
+                # Skip invalid values
+                print(f"Warning: Value '{flag_value}' failed validation for data type {data_type}: {e}")
+        return pd.Series(converted, index=list(converted), dtype=object)
+    
     def _convert_flags_to_list(self, flag_columns: List[pd.Series], column_names: List[str], list_format: str, data_type: str) -> pd.Series:
         """Convert multiple flag columns (1/0) into a list of 0 and 1 values"""
-        result = []
-        
-        for i in range(len(flag_columns[0])):
-            active_items = []
-            for j, col_series in enumerate(flag_columns):
-                # Get the actual flag value (0 or 1)
-                flag_value = col_series.iloc[i] if i < len(col_series) else 0
-                if pd.notna(flag_value):
-                    # Convert to the appropriate data type
-                    try:
-                        if data_type == 'CODE':
-                            # For CODE type, just use the flag value (0 or 1) as string
-                            validated_value = str(int(flag_value))
-                        elif data_type == 'INTEGE':
-                            validated_value = int(flag_value)
-                        elif data_type == 'DECIMA':
-                            validated_value = float(flag_value)
-                        elif data_type == 'DATE':
-                            validated_value = self._convert_date(flag_value)
-                        else:
-                            validated_value = flag_value
-                        
-                        active_items.append(validated_value)
-                    except Exception as e:
-                        # Skip invalid values
-                        print(f"Warning: Value '{flag_value}' failed validation for data type {data_type}: {e}")
-            
-            # Convert list to appropriate format
-            if list_format == "list_in_single_string":
-                if active_items:
-                    result.append(";".join(str(item) for item in active_items))
-                else:
-                    result.append("")
-            else:  # list_in_multiple_rows
-                if active_items:
-                    result.append(str(active_items))
-                else:
-                    result.append("")
+        converted = [self._convert_flag_column(col_series, data_type) for col_series in flag_columns]
+        
+        # One entry per active item, ordered by row and then by flag column
+        items = pd.concat(converted, axis=1, keys=range(len(converted))).reindex(flag_columns[0].index)
+        items = items.stack().dropna()
         
-        return pd.Series(result)
+        # Convert list to appropriate format
+        if list_format == "list_in_single_string":
+            result = items.astype(str).groupby(level=0).agg(';'.join)
+        else:  # list_in_multiple_rows
+            item_text = items.astype(str)
+            if data_type in ('CODE', 'DATE'):
+                item_text = "'" + item_text + "'"
+            result = '[' + item_text.groupby(level=0).agg(', '.join) + ']'
+        
+        return result.reindex(flag_columns[0].index, fill_value="").astype(object)
+    
+    def _parse_list_items(self, list_values: pd.Series, split_single_string: bool = False) -> pd.Series:
+        """Parse "['a', 'b']" list strings into one non-empty item per entry, indexed by source row"""
+        is_list = list_values.str.startswith('[', na=False) & list_values.str.endswith(']', na=False)
+        items = list_values[is_list].str.strip('[]').str.replace("'", "", regex=False).str.split(', ')
+        
+        if split_single_string:
+            # Handle list_in_single_string format
+            is_delimited = ~is_list & list_values.str.contains(';', na=False, regex=False)
+            items = pd.concat([items, list_values[is_delimited].str.split(';')]).sort_index(kind='stable')
+        
+        items = items.explode().str.strip()
+        return items[items.fillna('') != '']
     
     def _explode_list_column(self, df: pd.DataFrame, list_column: str, id_col: str) -> pd.DataFrame:
         """Explode a list column into separate rows, keeping first row with all values, others with NA"""
-        exploded_rows = []
+        df = df.reset_index(drop=True)
+        items = self._parse_list_items(df[list_column].astype(object))
         
-        for idx, row in df.iterrows():
-            policy_number = row[id_col]
-            list_value = row[list_column]
-            
-            # Parse the list string back to actual list
-            if isinstance(list_value, str) and list_value.startswith('[') and list_value.endswith(']'):
-                try:
-                    # Simple parsing for the list format we created
-                    items = list_value.strip('[]').replace("'", "").split(', ')
-                    items = [item.strip() for item in items if item.strip()]
-                except:
-                    items = []
-            else:
-                items = []
-            
-            if items:
-                # First row: keep all original values with the first list item
-                first_row = row.copy()
-                first_row[list_column] = items[0]
-                exploded_rows.append(first_row)
-                
-                # Additional rows: keep only policy number and list item, set others to NA
-                for item in items[1:]:
-                    new_row = row.copy()
-                    # Set all columns to NA except policy number and the list item
-                    for col in new_row.index:
-                        if col != id_col and col != list_column:
-                            new_row[col] = np.nan
-                    # Set the list column to the individual item
-                    new_row[list_column] = item
-                    exploded_rows.append(new_row)
-            else:
-                # If no items, keep the original row unchanged
-                exploded_rows.append(row.copy())
+        # Rows without any list items are kept unchanged, in their original position
+        no_items = df.index.difference(items.index)
+        values = items
+        if not no_items.empty:
+            values = pd.concat([items, df.loc[no_items, list_column]]).sort_index(kind='stable')
+        
+        exploded = df.loc[values.index].reset_index(drop=True)
+        exploded[list_column] = values.to_numpy()
         
-        return pd.DataFrame(exploded_rows)
+        # Additional rows: keep only the id and the list item, set others to NA
+        first_rows = ~values.index.duplicated()
+        for col in exploded.columns:
+            if col != id_col and col != list_column:
+                exploded[col] = _blank_additional_rows(exploded[col], first_rows)
+        
+        return exploded
     
     def _apply_value_mapping(self, col_data: pd.Series, column_name: str, value_mappings: Dict[str, Dict[str, str]]) -> pd.Series:
         """Apply individual value mappings to a column if available"""
         if column_name in value_mappings:
             value_mapping = value_mappings[column_name]
-            return col_data.apply(lambda x: value_mapping.get(str(x).strip(), x) if pd.notna(x) else x)
+            # Look up each distinct value once and spread the results back through the integer codes
+            codes, uniques = pd.factorize(col_data)
+            mapped_uniques = pd.Series(pd.Index(uniques).astype(str).str.strip()).map(value_mapping).to_numpy(dtype=object)
+            # Missing values have code -1 and no entry in uniques, so only index the valid codes
+            valid = codes >= 0
+            mapped = np.full(len(codes), np.nan, dtype=object)
+            mapped[valid] = mapped_uniques[codes[valid]]
+            # Keep missing values and values without a mapping unchanged
+            keep = ~valid | pd.isna(mapped)
+            return col_data.where(keep, pd.Series(mapped, index=col_data.index))
         return col_data
     
-    def convert_data_types(self, df: pd.DataFrame, column_mapping: Dict[str, Dict[str, Any]], value_mappings: Dict[str, Dict[str, str]] = None) -> pd.DataFrame:
-        """Convert data types according to mapping specifications"""
-        converted_df = pd.DataFrame()
-        actual_columns = set(df.columns)
+    def _convert_column(self, new_col: str, mappings: List[Tuple[str, Dict[str, Any]]], df: pd.DataFrame, actual_columns: Dict[str, str], value_mappings: Dict[str, Dict[str, str]]) -> pd.Series:
+        """Convert the source column(s) for one output column, or return None to skip it"""
+        # Check if this is a list column (multiple mappings or list_flag=True)
+        is_list_column = len(mappings) > 1 or any(m[1]['list_flag'] for m in mappings)
         
-        # Group mappings by new column name to handle list columns
-        grouped_mappings = {}
-        for original_col, mapping_info in column_mapping.items():
-            new_col = mapping_info['new_column']
-            if new_col not in grouped_mappings:
-                grouped_mappings[new_col] = []
-            grouped_mappings[new_col].append((original_col, mapping_info))
-        
-        for new_col, mappings in grouped_mappings.items():
-            # Check if this is a list column (multiple mappings or list_flag=True)
-            is_list_column = len(mappings) > 1 or any(m[1]['list_flag'] for m in mappings)
+        if not is_list_column:
+            # Single column mapping - process normally
+            original_col, mapping_info = mappings[0]
+            data_type = mapping_info['data_type']
+            
+            # Find the actual column name that matches the mapping
+            actual_col_name = actual_columns[original_col]
             
-            if not is_list_column:
-                # Single column mapping - process normally
-                original_col, mapping_info = mappings[0]
+            # Skip optional columns that don't exist in input
+            if actual_col_name is None and mapping_info['optional']:
+                print(f"Warning: Optional column '{original_col}' not found in input data")
+                return None
+            elif actual_col_name is None and not mapping_info['optional']:
+                raise ValueError(f"Required column '{original_col}' not found in input data")
+            
+            # Get the column data
+            if actual_col_name is not None:
+                col_data = df[actual_col_name]
+            else:
+                col_data = pd.Series(np.full(len(df), np.nan), index=df.index)
+            
+            # Convert data type with validation (skip validation for optional columns)
+            try:
+                converter = self._converters.get(data_type)
+                if converter is None:
+                    raise ValueError(f"Unknown data type: {data_type}")
+                
+                # For required columns, apply value mapping first if available
+                if not mapping_info['optional'] and value_mappings:
+                    col_data = self._apply_value_mapping(col_data, original_col, value_mappings)
+                
+                return converter(col_data, validate=not mapping_info['optional'])
+                
+            except Exception as e:
+                raise ValueError(f"Failed to convert column '{original_col}' to {data_type}: {e}")
+        
+        else:
+            # List column - handle multiple source columns
+            print(f"Processing list column for {new_col} with {len(mappings)} source columns")
+            
+            # Collect all matching columns
+            flag_columns = []
+            column_names = []
+            
+            for original_col, mapping_info in mappings:
                 data_type = mapping_info['data_type']
                 
                 # Find the actual column name that matches the mapping
-                actual_col_name = self._find_matching_column(original_col, actual_columns)
+                actual_col_name = actual_columns[original_col]
                 
-                # Skip optional columns that don't exist in input
-                if actual_col_name is None and mapping_info['optional']:
-                    print(f"Warning: Optional column '{original_col}' not found in input data")
-                    continue
-                elif actual_col_name is None and not mapping_info['optional']:
-                    raise ValueError(f"Required column '{original_col}' not found in input data")
-                
-                # Get the column data
                 if actual_col_name is not None:
-                    col_data = df[actual_col_name]
-                else:
-                    col_data = pd.Series([np.nan] * len(df))
-                
-                # Convert data type with validation (skip validation for optional columns)
+                    flag_columns.append(df[actual_col_name])
+                    column_names.append(original_col)
+                elif not mapping_info['optional']:
+                    raise ValueError(f"Required column '{original_col}' not found in input data")
+            
+            if flag_columns:
+                # Convert multiple flag columns to list
                 try:
-                    if mapping_info['optional']:
-                        # For optional columns, just convert without validation
-                        if data_type == 'CODE':
-                            converted_data = col_data.astype(str).replace('nan', np.nan)
-                        elif data_type == 'INTEGE':
-                            converted_data = pd.to_numeric(col_data, errors='coerce').astype('Int64')
-                        elif data_type == 'DECIMA':
-                            converted_data = pd.to_numeric(col_data, errors='coerce').astype('float64')
-                        elif data_type == 'DATE':
-                            converted_data = col_data.apply(lambda x: self._convert_date(x) if pd.notna(x) else x)
-                        else:
-                            raise ValueError(f"Unknown data type: {data_type}")
-                    else:
-                        # For required columns, apply full validation
-                        if data_type == 'CODE':
-                            # Apply value mapping first if available
-                            if value_mappings:
-                                col_data = self._apply_value_mapping(col_data, original_col, value_mappings)
-                            # Apply CODE validation to each value
-                            converted_data = col_data.apply(lambda x: self._validate_code(x) if pd.notna(x) else x)
-                        elif data_type == 'INTEGE':
-                            # Apply value mapping first if available
-                            if value_mappings:
-                                col_data = self._apply_value_mapping(col_data, original_col, value_mappings)
-                            # Apply INTEGE validation to each value
-                            converted_data = col_data.apply(lambda x: self._validate_intege(x) if pd.notna(x) else x)
-                        elif data_type == 'DECIMA':
-                            # Apply value mapping first if available
-                            if value_mappings:
-                                col_data = self._apply_value_mapping(col_data, original_col, value_mappings)
-                            # Apply DECIMA validation to each value
-                            converted_data = col_data.apply(lambda x: self._validate_decima(x) if pd.notna(x) else x)
-                        elif data_type == 'DATE':
-                            # Apply value mapping first if available
-                            if value_mappings:
-                                col_data = self._apply_value_mapping(col_data, original_col, value_mappings)
-                            # Apply DATE conversion to each value
-                            converted_data = col_data.apply(lambda x: self._convert_date(x) if pd.notna(x) else x)
-                        else:
-                            raise ValueError(f"Unknown data type: {data_type}")
-                    
-                    converted_df[new_col] = converted_data
-                    
+                    list_format = self.config_loader.get_processing_config().get('list_format', 'list_in_multiple_rows')
+                    # Get the data type from the first mapping (all should be the same for list columns)
+                    data_type = mappings[0][1]['data_type']
+                    converted_data = self._convert_flags_to_list(flag_columns, column_names, list_format, data_type)
+                    return converted_data
                 except Exception as e:
-                    raise ValueError(f"Failed to convert column '{original_col}' to {data_type}: {e}")
-            
+                    raise ValueError(f"Failed to convert columns to list for {new_col}: {e}")
             else:
-                # List column - handle multiple source columns
-                print(f"Processing list column for {new_col} with {len(mappings)} source columns")
-                
-                # Collect all matching columns
-                flag_columns = []
-                column_names = []
-                
-                for original_col, mapping_info in mappings:
-                    data_type = mapping_info['data_type']
-                    
-                    # Find the actual column name that matches the mapping
-                    actual_col_name = self._find_matching_column(original_col, actual_columns)
-                    
-                    if actual_col_name is not None:
-                        flag_columns.append(df[actual_col_name])
-                        column_names.append(original_col)
-                    elif not mapping_info['optional']:
-                        raise ValueError(f"Required column '{original_col}' not found in input data")
-                
-                if flag_columns:
-                    # Convert multiple flag columns to list
-                    try:
-                        list_format = self.config_loader.get_processing_config().get('list_format', 'list_in_multiple_rows')
-                        # Get the data type from the first mapping (all should be the same for list columns)
-                        data_type = mappings[0][1]['data_type']
-                        converted_data = self._convert_flags_to_list(flag_columns, column_names, list_format, data_type)
-                        converted_df[new_col] = converted_data
-                    except Exception as e:
-                        raise ValueError(f"Failed to convert columns to list for {new_col}: {e}")
-                else:
-                    # No matching columns found, but all were optional
-                    list_format = self.config_loader.get_processing_config().get('list_format', 'list_in_multiple_rows')
-                    converted_df[new_col] = pd.Series([""] * len(df))
+                # No matching columns found, but all were optional
+                list_format = self.config_loader.get_processing_config().get('list_format', 'list_in_multiple_rows')
+                return pd.Series(np.full(len(df), "", dtype=object), index=df.index)
+    
+    def convert_data_types(self, df: pd.DataFrame, column_mapping: Dict[str, Dict[str, Any]], value_mappings: Dict[str, Dict[str, str]] = None) -> pd.DataFrame:
+        """Convert data types according to mapping specifications"""
+        actual_columns = resolve_columns(column_mapping, df.columns)
         
-        return converted_df
+        # Group mappings by new column name to handle list columns
+        grouped_mappings = group_mappings(column_mapping)
+        
+        # Columns convert independently, so run them in parallel; pandas/NumPy release the GIL
+        with ThreadPoolExecutor(max_workers=max(1, min(len(grouped_mappings), os.cpu_count() or 4))) as executor:
+            converted_columns = executor.map(
+                lambda item: self._convert_column(item[0], item[1], df, actual_columns, value_mappings),
+                grouped_mappings.items()
+            )
+            # Results come back in mapping order; the first failing column raises here
+            converted = {new_col: converted_data
+                         for new_col, converted_data in zip(grouped_mappings, converted_columns)
+                         if converted_data is not None}
+        
+        return pd.DataFrame(converted)
     
-    def _find_matching_column(self, target_col: str, actual_columns: set) -> str:
-        """Find matching column name with case-insensitive and space/underscore variations"""
-        if target_col in actual_columns:
-            return target_col
-        
-        # Try to find a matching column (case-insensitive, space/underscore variations)
-        for actual_col in actual_columns:
-            normalized_target = target_col.lower().replace('_', ' ').strip()
-            normalized_actual = actual_col.lower().replace('_', ' ').strip()
-            if normalized_target == normalized_actual:
-                return actual_col
-        return None
+    def convert_data_types_parallel(self, df: pd.DataFrame, column_mapping: Dict[str, Dict[str, Any]], value_mappings: Dict[str, Dict[str, str]] = None, npartitions: int = None) -> pd.DataFrame:
+        """Convert data types in row partitions with Dask when the input exceeds dask_row_threshold"""
+        row_threshold = self.config_loader.get_processing_config().get('dask_row_threshold')
+        if not row_threshold or len(df) <= row_threshold:
+            return self.convert_data_types(df, column_mapping, value_mappings)
+        
+        try:
+            import dask.dataframe as dd
+        except ImportError:
+            print("Warning: dask is not installed, converting without row partitions")
+            return self.convert_data_types(df, column_mapping, value_mappings)
+        
+        # Every conversion is row-wise, so partitions convert independently across cores
+        npartitions = npartitions or os.cpu_count() or 1
+        print(f"Converting {len(df)} rows in {npartitions} partitions with Dask")
+        ddf = dd.from_pandas(df, npartitions=npartitions)
+        meta = self.convert_data_types(df.head(0), column_mapping, value_mappings)
+        return ddf.map_partitions(self.convert_data_types, column_mapping, value_mappings, meta=meta).compute()
     
     def _find_list_columns(self, column_mapping: Dict[str, Dict[str, Any]]) -> List[str]:
         """Find columns that are list type in the mapping using list_flag"""
@@ -344,64 +496,34 @@ class DataConverter:
     
     def _explode_multiple_list_columns(self, df: pd.DataFrame, list_columns: List[str], id_col: str) -> pd.DataFrame:
         """Explode multiple list columns simultaneously, matching the longest list length"""
-        exploded_rows = []
+        df = df.reset_index(drop=True)
         
-        for idx, row in df.iterrows():
-            policy_number = row[id_col]
-            
-            # Parse all list columns to get their items
-            list_items = {}
-            max_length = 0
-            
-            for list_col in list_columns:
-                list_value = row[list_col]
-                items = []
-                
-                # Parse the list string back to actual list
-                if isinstance(list_value, str) and list_value.startswith('[') and list_value.endswith(']'):
-                    try:
-                        # Simple parsing for the list format we created
-                        items = list_value.strip('[]').replace("'", "").split(', ')
-                        items = [item.strip() for item in items if item.strip()]
-                    except:
-                        items = []
-                elif isinstance(list_value, str) and ';' in list_value:
-                    # Handle list_in_single_string format
-                    items = [item.strip() for item in list_value.split(';') if item.strip()]
-                else:
-                    items = []
-                
-                list_items[list_col] = items
-                max_length = max(max_length, len(items))
-            
-            # If no lists have items, keep the original row
-            if max_length == 0:
-                exploded_rows.append(row.copy())
-                continue
-            
-            # Create rows for each position in the lists
-            for i in range(max_length):
-                new_row = row.copy()
-                
-                # For each list column, set the value at position i
-                for list_col in list_columns:
-                    items = list_items[list_col]
-                    if i < len(items):
-                        new_row[list_col] = items[i]
-                    else:
-                        # If this list is shorter than the longest, set to empty
-                        new_row[list_col] = ""
-                
-                # For the first row, keep all original values
-                if i > 0:
-                    # For additional rows, set non-list columns to NA except policy number
-                    for col in new_row.index:
-                        if col != id_col and col not in list_columns:
-                            new_row[col] = np.nan
-                
-                exploded_rows.append(new_row)
+        # Parse all list columns, numbering the items within each source row
+        positioned_items = []
+        for list_col in list_columns:
+            items = self._parse_list_items(df[list_col].astype(object), split_single_string=True)
+            positions = items.groupby(level=0).cumcount()
+            items.index = pd.MultiIndex.from_arrays([items.index, positions])
+            positioned_items.append(items.rename(list_col))
+        
+        # Align the lists by position; lists shorter than the longest are set to empty
+        list_items = pd.concat(positioned_items, axis=1).astype(object).fillna('').sort_index()
+        rows = list_items.index.get_level_values(0)
+        
+        exploded = df.loc[rows]
+        exploded[list_columns] = list_items[list_columns].to_numpy()
+        
+        # If no lists have items, keep the original row in its original position
+        no_items = df.index.difference(rows)
+        if not no_items.empty:
+            exploded = pd.concat([exploded, df.loc[no_items]]).sort_index(kind='stable')
         
-        return pd.DataFrame(exploded_rows)
+        # For additional rows, set non-list columns to NA except the id
+        first_rows = ~exploded.index.duplicated()
+        for col in exploded.columns:
+            if col != id_col and col not in list_columns:
+                exploded[col] = _blank_additional_rows(exploded[col], first_rows)
+        return exploded.reset_index(drop=True)
     
     def process_list_columns(self, df: pd.DataFrame, column_mapping: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
         """Process LIST columns according to the configured format"""
@@ -3,9 +3,31 @@ Data loader module for data conversion tool using Pandas
 """
 
 import pandas as pd
+import numpy as np
 import os
+from importlib.util import find_spec
 from typing import Dict, Any
 
+from .column_matching import group_mappings, resolve_columns
+
+# Use the multithreaded Arrow CSV reader and the Rust-based calamine Excel reader when installed
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') else 'c'
+EXCEL_ENGINE = 'calamine' if find_spec('python_calamine') else None
+
+
+def _arrow_string_dtype():
+    """Arrow-backed string dtype with NaN missing values, or None if unavailable"""
+    if not find_spec('pyarrow'):
+        return None
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:
+        # pandas < 2.3 has no NaN-semantics Arrow string dtype
+        return None
+
+
+ARROW_STRING_DTYPE = _arrow_string_dtype()
+
 
 class DataLoader:
     """Loads and validates input data using Pandas"""
@@ -23,6 +45,34 @@ class DataLoader:
         else:
             raise ValueError(f"Unsupported file type: {ext}")
     
+    def _to_arrow_strings(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store all-string object columns as Arrow strings so .str operations run in Arrow kernels"""
+        if ARROW_STRING_DTYPE is None:
+            return df
+        for col in df.columns[df.dtypes == object]:
+            # Mixed columns (e.g. dates next to Excel serial numbers) keep their original values
+            if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+                df[col] = df[col].astype(ARROW_STRING_DTYPE)
+        return df
+    
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Read a CSV file, keeping date and time columns as text like the C reader does"""
+        df = pd.read_csv(file_path, engine=CSV_ENGINE)
+        if CSV_ENGINE != 'pyarrow':
+            return df
+        
+        # The Arrow reader infers ISO dates, times and timestamps, but the DATE converter
+        # expects the original text, so read just those columns again as strings. The C reader
+        # is used for this, as the Arrow reader turns blank cells into the text 'None' with dtype=str
+        temporal_cols = [
+            col for col in df.columns
+            if pd.api.types.is_datetime64_any_dtype(df[col].dtype)
+            or pd.api.types.infer_dtype(df[col], skipna=True) in ('date', 'time')
+        ]
+        if temporal_cols:
+            df[temporal_cols] = pd.read_csv(file_path, engine='c', usecols=temporal_cols, dtype=str)[temporal_cols]
+        return df
+    
     def load_input_data(self, file_path: str, file_type: str = 'auto') -> pd.DataFrame:
         """Load input data from file"""
         if file_type == 'auto':
@@ -30,43 +80,26 @@ class DataLoader:
         
         try:
             if file_type == 'excel':
-                df = pd.read_excel(file_path)
+                df = pd.read_excel(file_path, engine=EXCEL_ENGINE)
             elif file_type == 'csv':
-                df = pd.read_csv(file_path)
+                df = self._read_csv(file_path)
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
             
+            df = self._to_arrow_strings(df)
             print(f"Successfully loaded data from {file_path}")
             return df
             
         except Exception as e:
             raise ValueError(f"Failed to load input file {file_path}: {e}")
     
-    def _find_matching_column(self, target_col: str, actual_columns: set) -> str:
-        """Find matching column name with case-insensitive and space/underscore variations"""
-        if target_col in actual_columns:
-            return target_col
-        
-        # Try to find a matching column (case-insensitive, space/underscore variations)
-        for actual_col in actual_columns:
-            normalized_target = target_col.lower().replace('_', ' ').strip()
-            normalized_actual = actual_col.lower().replace('_', ' ').strip()
-            if normalized_target == normalized_actual:
-                return actual_col
-        return None
-    
     def validate_input_data(self, df: pd.DataFrame, column_mapping: Dict[str, Dict[str, Any]]) -> None:
         """Validate input data against mapping requirements"""
         missing_columns = []
-        actual_columns = set(df.columns)
+        actual_columns = resolve_columns(column_mapping, df.columns)
         
         # Group mappings by new column to handle LIST type validation
-        grouped_mappings = {}
-        for original_col, mapping_info in column_mapping.items():
-            new_col = mapping_info['new_column']
-            if new_col not in grouped_mappings:
-                grouped_mappings[new_col] = []
-            grouped_mappings[new_col].append((original_col, mapping_info))
+        grouped_mappings = group_mappings(column_mapping)
         
         # Validate required columns
         for new_col, mappings in grouped_mappings.items():
@@ -76,7 +109,7 @@ class DataLoader:
                 found_any = False
                 for original_col, mapping_info in mappings:
                     if not mapping_info['optional']:
-                        if self._find_matching_column(original_col, actual_columns) is not None:
+                        if actual_columns[original_col] is not None:
                             found_any = True
                             break
                 
@@ -86,7 +119,7 @@ class DataLoader:
                 # Single column mapping - validate normally
                 original_col, mapping_info = mappings[0]
                 if not mapping_info['optional']:
-                    if self._find_matching_column(original_col, actual_columns) is None:
+                    if actual_columns[original_col] is None:
                         missing_columns.append(original_col)
         
         if missing_columns:
@@ -4,20 +4,32 @@ Mapping processor module for data conversion tool using Pandas
 
 import pandas as pd
 import os
+from contextlib import nullcontext
 from typing import Dict, List, Any
 
+# Stream mapping workbooks in openpyxl read-only mode, reading cached values instead of formulas
+EXCEL_READ_OPTIONS = {'engine': 'openpyxl', 'engine_kwargs': {'read_only': True, 'data_only': True}}
+
+# Read mapping cells as strings (missing cells stay NaN) instead of inferring per-column dtypes
+MAPPING_RULE_DTYPES = {col: str for col in ['Original Column', 'New Column', 'Data Type', 'List', 'Required']}
+VALUE_MAPPING_DTYPES = {'From': str, 'To': str}
 
 class MappingProcessor:
     """Processes column mapping rules using Pandas"""
     
     def __init__(self, config_loader):
         self.config_loader = config_loader
+        # Upper-cased Required values of the last validated mapping frame
+        self._validated_df = None
+        self._norm_required = None
+    
+    def _as_stripped_str(self, series: pd.Series) -> pd.Series:
+        """Convert a mapping column to stripped strings, as str(value).strip() would per cell"""
+        return series.astype(str).fillna('nan').str.strip()
     
-    def load_mapping_rules(self) -> pd.DataFrame:
-        """Load mapping rules from Excel file"""
-        mapping_config = self.config_loader.get_mapping_config()
-        mapping_file_path = mapping_config.get('file_path')
-        sheet_name = mapping_config.get('sheet_name', 'column mapping')
+    def _get_mapping_file_path(self) -> str:
+        """Get the configured mapping file path, checking that it exists"""
+        mapping_file_path = self.config_loader.get_mapping_config().get('file_path')
         
         if not mapping_file_path:
             raise ValueError("Mapping file path not specified in configuration")
@@ -25,13 +37,31 @@ class MappingProcessor:
         if not os.path.exists(mapping_file_path):
             raise FileNotFoundError(f"Mapping file not found: {mapping_file_path}")
         
+        return mapping_file_path
+    
+    def load_mapping_rules(self, excel_file: pd.ExcelFile = None) -> pd.DataFrame:
+        """Load mapping rules from Excel file, or from an already opened workbook"""
+        mapping_file_path = self._get_mapping_file_path()
+        sheet_name = self.config_loader.get_mapping_config().get('sheet_name', 'column mapping')
+        
         try:
-            mapping_df = pd.read_excel(mapping_file_path, sheet_name=sheet_name)
+            if excel_file is not None:
+                mapping_df = excel_file.parse(sheet_name, dtype=MAPPING_RULE_DTYPES)
+            else:
+                mapping_df = pd.read_excel(mapping_file_path, sheet_name=sheet_name, dtype=MAPPING_RULE_DTYPES,
+                                           **EXCEL_READ_OPTIONS)
             print(f"Loaded {len(mapping_df)} mapping rules from {sheet_name}")
             return mapping_df
         except Exception as e:
             raise ValueError(f"Failed to load mapping file: {e}")
     
+    def _invalid_values(self, values: pd.Series, normalized: pd.Series, valid_values: List[str]) -> List[Any]:
+        """Return the distinct original values whose normalized form is not valid"""
+        invalid = set(normalized.unique()) - set(valid_values)
+        if not invalid:
+            return []
+        return values[normalized.isin(invalid)].unique().tolist()
+    
     def validate_mapping_rules(self, mapping_df: pd.DataFrame) -> bool:
         """Validate mapping rules structure"""
         required_columns = ['Original Column', 'New Column', 'Data Type', 'List', 'Required']
@@ -42,87 +72,101 @@ class MappingProcessor:
         
         # Validate data types
         valid_data_types = ['CODE', 'INTEGE', 'DECIMA', 'DATE']
-        invalid_types = mapping_df[~mapping_df['Data Type'].str.upper().isin(valid_data_types)]
+        invalid_list = self._invalid_values(mapping_df['Data Type'], mapping_df['Data Type'].str.upper(), valid_data_types)
         
-        if len(invalid_types) > 0:
-            invalid_list = invalid_types['Data Type'].unique().tolist()
+        if invalid_list:
             raise ValueError(f"Invalid data types found: {invalid_list}. Valid types: {valid_data_types}")
         
         # Validate List column values
         valid_list_values = ['Y', 'N']
-        invalid_list = mapping_df[~mapping_df['List'].astype(str).str.upper().isin(valid_list_values)]
+        invalid_list_values = self._invalid_values(mapping_df['List'], mapping_df['List'].astype(str).str.upper(), valid_list_values)
         
-        if len(invalid_list) > 0:
-            invalid_list_values = invalid_list['List'].unique().tolist()
+        if invalid_list_values:
             raise ValueError(f"Invalid List values found: {invalid_list_values}. Valid values: {valid_list_values}")
         
         # Validate Required column values
         valid_required_values = ['YES', 'NO', 'Y', 'N']
-        invalid_required = mapping_df[~mapping_df['Required'].astype(str).str.upper().isin(valid_required_values)]
+        norm_required = mapping_df['Required'].astype(str).str.upper()
+        invalid_required_values = self._invalid_values(mapping_df['Required'], norm_required, valid_required_values)
         
-        if len(invalid_required) > 0:
-            invalid_required_values = invalid_required['Required'].unique().tolist()
+        if invalid_required_values:
             raise ValueError(f"Invalid Required values found: {invalid_required_values}. Valid values: {valid_required_values}")
         
+        # Keep the normalized Required values for get_required_columns
+        self._validated_df = mapping_df
+        self._norm_required = norm_required
+        
         return True
     
     def get_column_mapping(self, mapping_df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         """Create column mapping dictionary"""
-        mapping_dict = {}
-        
-        for _, row in mapping_df.iterrows():
-            mapping_dict[str(row['Original Column']).strip()] = {
-                'new_column': str(row['New Column']).strip().upper(),  # Ensure uppercase
-                'data_type': str(row['Data Type']).strip().upper(),    # Ensure uppercase
-                'list_flag': str(row['List']).strip().upper() == 'Y',  # Convert to boolean
-                'optional': str(row['Required']).strip().upper() in ['NO', 'FALSE', '0', 'N']  # Negate Required logic
-            }
+        original_columns = self._as_stripped_str(mapping_df['Original Column'])
+        new_columns = self._as_stripped_str(mapping_df['New Column']).str.upper()  # Ensure uppercase
+        data_types = self._as_stripped_str(mapping_df['Data Type']).str.upper()    # Ensure uppercase
+        list_flags = self._as_stripped_str(mapping_df['List']).str.upper() == 'Y'  # Convert to boolean
+        optional = self._as_stripped_str(mapping_df['Required']).str.upper().isin(['NO', 'FALSE', '0', 'N'])  # Negate Required logic
         
-        return mapping_dict
+        return {
+            original_col: {
+                'new_column': new_col,
+                'data_type': data_type,
+                'list_flag': bool(list_flag),
+                'optional': bool(is_optional)
+            }
+            for original_col, new_col, data_type, list_flag, is_optional in zip(
+                original_columns.tolist(), new_columns.tolist(), data_types.tolist(),
+                list_flags.tolist(), optional.tolist()
+            )
+        }
     
     def get_required_columns(self, mapping_df: pd.DataFrame) -> List[str]:
         """Get list of required columns (Required = YES)"""
-        required_df = mapping_df[
-            mapping_df['Required'].astype(str).str.upper().isin(['YES', 'TRUE', '1', 'Y'])
-        ]
-        required_columns = required_df['Original Column'].astype(str).str.strip().tolist()
+        if mapping_df is self._validated_df:
+            norm_required = self._norm_required
+        else:
+            norm_required = mapping_df['Required'].astype(str).str.upper()
         
-        return required_columns
+        required_mask = norm_required.isin(['YES', 'TRUE', '1', 'Y'])
+        return self._as_stripped_str(mapping_df.loc[required_mask, 'Original Column']).tolist()
     
-    def load_value_mappings(self, mapping_file_path: str) -> Dict[str, Dict[str, str]]:
+    def load_value_mappings(self, mapping_file_path: str, excel_file: pd.ExcelFile = None) -> Dict[str, Dict[str, str]]:
         """Load individual value mappings from separate tabs"""
         value_mappings = {}
         
         try:
-            # Get all sheet names in the mapping file
-            excel_file = pd.ExcelFile(mapping_file_path)
-            sheet_names = excel_file.sheet_names
-            
-            # Skip the main mapping sheet
-            main_sheet = self.config_loader.get_mapping_config().get('sheet_name', 'column mapping')
-            value_sheets = [sheet for sheet in sheet_names if sheet != main_sheet]
-            
-            for sheet_name in value_sheets:
-                try:
-                    # Load the value mapping sheet
-                    value_df = pd.read_excel(mapping_file_path, sheet_name=sheet_name)
-                    
-                    # Validate the value mapping structure
-                    if 'From' in value_df.columns and 'To' in value_df.columns:
+            # Read every value mapping sheet from one workbook handle, reusing the caller's if given
+            if excel_file is None:
+                workbook = pd.ExcelFile(mapping_file_path, **EXCEL_READ_OPTIONS)
+            else:
+                workbook = nullcontext(excel_file)
+            with workbook as excel_file:
+                sheet_names = excel_file.sheet_names
+                
+                # Skip the main mapping sheet
+                main_sheet = self.config_loader.get_mapping_config().get('sheet_name', 'column mapping')
+                value_sheets = [sheet for sheet in sheet_names if sheet != main_sheet]
+                
+                for sheet_name in value_sheets:
+                    try:
+                        # Validate the value mapping structure from the header row alone, so other tabs are never fully parsed
+                        header_df = excel_file.parse(sheet_name=sheet_name, nrows=0)
+                        if 'From' not in header_df.columns or 'To' not in header_df.columns:
+                            print(f"Warning: Value mapping sheet '{sheet_name}' missing 'From' or 'To' columns")
+                            continue
+                        
+                        # Parse each sheet on its own so one unreadable tab only skips that mapping
+                        value_df = excel_file.parse(sheet_name=sheet_name, dtype=VALUE_MAPPING_DTYPES)
+                        
                         # Create a mapping dictionary for this column
-                        value_mapping = {}
-                        for _, row in value_df.iterrows():
-                            from_value = str(row['From']).strip()
-                            to_value = str(row['To']).strip()
-                            value_mapping[from_value] = to_value
+                        from_values = self._as_stripped_str(value_df['From'])
+                        to_values = self._as_stripped_str(value_df['To'])
+                        value_mapping = dict(zip(from_values.tolist(), to_values.tolist()))
                         
                         value_mappings[sheet_name] = value_mapping
                         print(f"Loaded value mapping for '{sheet_name}': {len(value_mapping)} mappings")
-                    else:
-                        print(f"Warning: Value mapping sheet '{sheet_name}' missing 'From' or 'To' columns")
                         
-                except Exception as e:
-                    print(f"Warning: Failed to load value mapping from sheet '{sheet_name}': {e}")
+                    except Exception as e:
+                        print(f"Warning: Failed to load value mapping from sheet '{sheet_name}': {e}")
         
         except Exception as e:
             print(f"Warning: Failed to load value mappings: {e}")
@@ -131,16 +175,25 @@ class MappingProcessor:
     
     def process_mapping(self) -> Dict[str, Any]:
         """Process and validate mapping rules"""
-        mapping_df = self.load_mapping_rules()
-        self.validate_mapping_rules(mapping_df)
+        mapping_file_path = self._get_mapping_file_path()
         
-        column_mapping = self.get_column_mapping(mapping_df)
-        required_columns = self.get_required_columns(mapping_df)
+        # Open the workbook once for the mapping rules and all value mapping sheets
+        try:
+            excel_file = pd.ExcelFile(mapping_file_path, **EXCEL_READ_OPTIONS)
+        except Exception as e:
+            raise ValueError(f"Failed to load mapping file: {e}")
         
-        # Load individual value mappings
-        mapping_config = self.config_loader.get_mapping_config()
-        mapping_file_path = mapping_config.get('file_path')
-        value_mappings = self.load_value_mappings(mapping_file_path)
+        try:
+            mapping_df = self.load_mapping_rules(excel_file)
+            self.validate_mapping_rules(mapping_df)
+            
+            column_mapping = self.get_column_mapping(mapping_df)
+            required_columns = self.get_required_columns(mapping_df)
+            
+            # Load individual value mappings
+            value_mappings = self.load_value_mappings(mapping_file_path, excel_file)
+        finally:
+            excel_file.close()
         
         return {
             'mapping_df': mapping_df,
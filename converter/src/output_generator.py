@@ -4,8 +4,16 @@ Output generator module for data conversion tool using Pandas
 
 import pandas as pd
 import os
+from importlib.util import find_spec
 from typing import Dict, Any
 
+# The native Arrow CSV writer can be selected with output.csv_writer: pyarrow when installed
+HAS_PYARROW = find_spec('pyarrow') is not None
+
+# Write Excel output with the faster xlsxwriter engine when installed. Its constant_memory
+# mode is not used: it only accepts row-by-row writes, and to_excel writes column by column.
+EXCEL_WRITER_OPTIONS = {'engine': 'xlsxwriter'} if find_spec('xlsxwriter') else {}
+
 
 class OutputGenerator:
     """Generates and saves output files using Pandas"""
@@ -23,11 +31,34 @@ class OutputGenerator:
         else:
             raise ValueError(f"Unsupported file type: {ext}")
     
+    def _write_csv(self, df: pd.DataFrame, output_path: str) -> None:
+        """Write a CSV file with pandas, or with pyarrow when configured
+        
+        The pyarrow writer is opt-in because its text differs from to_csv: the header
+        and strings are quoted and whole floats lose their trailing '.0'.
+        """
+        csv_writer = self.config_loader.get_output_config().get('csv_writer', 'pandas')
+        if csv_writer == 'pyarrow' and HAS_PYARROW:
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
+            
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type object columns have no Arrow type
+                table = None
+            
+            if table is not None:
+                pacsv.write_csv(table, output_path)
+                return
+        
+        df.to_csv(output_path, index=False)
+    
     def save_output_data(self, df: pd.DataFrame, output_path: str, file_type: str = 'csv') -> None:
         """Save processed data to output file"""
         try:
             # Ensure all column names are uppercase
-            df.columns = [col.upper() for col in df.columns]
+            df.columns = df.columns.str.upper()
             
             # Ensure output directory exists
             output_dir = os.path.dirname(output_path)
@@ -35,9 +66,10 @@ class OutputGenerator:
                 os.makedirs(output_dir, exist_ok=True)
             
             if file_type == 'excel':
-                df.to_excel(output_path, index=False)
+                with pd.ExcelWriter(output_path, **EXCEL_WRITER_OPTIONS) as writer:
+                    df.to_excel(writer, index=False)
             elif file_type == 'csv':
-                df.to_csv(output_path, index=False)
+                self._write_csv(df, output_path)
             else:
                 raise ValueError(f"Unsupported output file type: {file_type}")
             
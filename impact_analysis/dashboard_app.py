@@ -8,8 +8,8 @@ import dash_bootstrap_components as dbc
 import logging
 import sys
 import os
-import yaml
 
+from .src.config_loader import load_config_file
 from .src.app_dashboard_state import dashboard_state
 from .src.app_dash_components import create_main_layout, log_capture, DashLogHandler
 from .src.app_callbacks import register_callbacks
@@ -73,8 +73,7 @@ class ImpactAnalysisDashboard:
     def _load_initial_config(self):
         """Load initial configuration into dashboard state"""
         try:
-            with open(self.config_path, 'r') as f:
-                config_yaml = yaml.safe_load(f)
+            config_yaml = load_config_file(self.config_path)
             
             dashboard_state.set_config(config_yaml, self.config_path)
             logger.info("Initial configuration loaded successfully")
@@ -9,16 +9,17 @@ import logging
 import json, pprint   # Added for pretty-printing debug info
 from typing import Dict
 
-from .src.config_loader import ConfigLoader
-from .src.data_processor import DataProcessor
-from .src.data_analyser import DataAnalyser
-from .src.visualizer import ReportVisualizer
-
 
 class ModularImpactAnalyzer:
     """Main class that orchestrates the modular impact analysis process"""
     
     def __init__(self, config_path: str = None):
+        # Imported here so importing this module does not pay for pandas/jinja2/highcharts
+        from .src.config_loader import ConfigLoader
+        from .src.data_processor import DataProcessor
+        from .src.data_analyser import DataAnalyser
+        from .src.visualizer import ReportVisualizer
+        
         # If no config path provided, use default relative to this module
         if config_path is None:
             module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,16 +42,30 @@ class ModularImpactAnalyzer:
         module_dir = os.path.dirname(os.path.abspath(__file__))
         log_path = os.path.join(module_dir, 'impact_analysis.log')
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(log_path)
-            ]
-        )
+        # basicConfig is a no-op once the root logger has handlers (e.g. under the dashboard);
+        # check first so the log file is not opened for a handler that would be discarded
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.StreamHandler(sys.stdout),
+                    logging.FileHandler(log_path, delay=True)
+                ]
+            )
         return logging.getLogger(__name__)
     
+    def _save_merged_data(self, merged_df, output_dir: str) -> str:
+        """Write the merged data as CSV, or as zstd Parquet when output.merged_format is parquet"""
+        if self.config_loader.get_merged_data_format() == 'parquet':
+            merged_output_path = os.path.join(output_dir, "merged_data.parquet")
+            merged_df.to_parquet(merged_output_path, index=False, compression='zstd')
+            return merged_output_path
+        
+        merged_output_path = os.path.join(output_dir, "merged_data.csv")
+        merged_df.to_csv(merged_output_path, index=False)
+        return merged_output_path
+    
     def save_output_files(self, merged_df, dict_distribution_summary: Dict, comparison_mapping: Dict) -> None:
         """Save all output files using Pandas"""
         import pandas as pd
@@ -58,8 +73,7 @@ class ModularImpactAnalyzer:
         os.makedirs(output_dir, exist_ok=True)
         
         # Save merged data
-        merged_output_path = os.path.join(output_dir, "merged_data.csv")
-        merged_df.to_csv(merged_output_path, index=False)
+        merged_output_path = self._save_merged_data(merged_df, output_dir)
         self.logger.info(f"Saved merged data to: {merged_output_path}")
         
         # Generate and save summary table using DataAnalyser
@@ -75,24 +89,23 @@ class ModularImpactAnalyzer:
         self.logger.info(f"Saved summary table to: {summary_output_path}")
         
         # Save band distribution for all comparison items and steps
-        all_band_summary = []
+        band_frames = []
         for item_name, analysis_data in dict_distribution_summary.items():
             for step, step_data in analysis_data['steps'].items():
-                step_name = step_data['step_name']
                 summary_by_band = step_data['summary_by_band']
                 if summary_by_band:
-                    for band_row in summary_by_band:
-                        all_band_summary.append({
-                            'Item': item_name,
-                            'Step': step,
-                            'StepName': step_name,
-                            'Band': band_row['band'],
-                            'Count': band_row['Count'],
-                            'Percentage': band_row['Percentage']
-                        })
+                    band_frames.append(
+                        pd.DataFrame(summary_by_band).assign(
+                            Item=item_name, Step=step, StepName=step_data['step_name']
+                        )
+                    )
         
-        if all_band_summary:
-            band_df = pd.DataFrame(all_band_summary)
+        if band_frames:
+            band_df = (
+                pd.concat(band_frames, ignore_index=True)
+                .rename(columns={'band': 'Band'})
+                [['Item', 'Step', 'StepName', 'Band', 'Count', 'Percentage']]
+            )
             band_output_path = os.path.join(output_dir, "band_distribution.csv")
             band_df.to_csv(band_output_path, index=False)
             self.logger.info(f"Saved band distribution to: {band_output_path}")
@@ -23,6 +23,19 @@ from ..main import ModularImpactAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Analyzer for the current config file, keyed by (path, mtime) so saving the config rebuilds it
+_analyzer_cache = {}
+
+
+def _get_analyzer(config_path: str) -> ModularImpactAnalyzer:
+    """Return a ModularImpactAnalyzer for config_path, reusing it until the file changes"""
+    key = (config_path, os.path.getmtime(config_path))
+    analyzer = _analyzer_cache.get(key)
+    if analyzer is None:
+        _analyzer_cache.clear()
+        analyzer = _analyzer_cache[key] = ModularImpactAnalyzer(config_path)
+    return analyzer
+
 
 def register_callbacks(app):
     """Register all dashboard callbacks"""
@@ -33,12 +46,12 @@ def register_callbacks(app):
     )
     def update_logs(n_intervals):
         """Update log display with captured logs"""
-        logs = log_capture.get_logs()
+        logs = log_capture.get_logs(last_n=100)  # Show last 100 logs
         if not logs:
             return "No logs yet..."
         
         # Join logs with newlines, show most recent last (at bottom)
-        log_text = '\n'.join(logs[-100:])  # Show last 100 logs
+        log_text = '\n'.join(logs)
         return log_text
     
     
@@ -141,7 +154,7 @@ def register_callbacks(app):
                 return f"Config error: {message}", False, True, True, True
             
             # Initialize data_analyser
-            data_analyser = ModularImpactAnalyzer(dashboard_state.config_path)
+            data_analyser = _get_analyzer(dashboard_state.config_path)
             
             # Load and process data
             merged_df, comparison_mapping = data_analyser.data_processor.process_data()
@@ -198,27 +211,37 @@ def register_callbacks(app):
                 return "No data matches the current filters."
             
             # Initialize data_analyser
-            data_analyser = ModularImpactAnalyzer(dashboard_state.config_path)
+            data_analyser = _get_analyzer(dashboard_state.config_path)
             
-            # Recalculate results with filtered data
-            dict_distribution_summary = data_analyser.data_analyser.generate_distribution_summary(
-                filtered_df, dashboard_state.comparison_mapping
-            )
-            dict_comparison_summary = data_analyser.data_analyser.generate_comparison_summary(
-                filtered_df, dashboard_state.comparison_mapping
-            )
+            # Reuse the results of a filter selection that was already refreshed
+            filter_key = dashboard_state.get_filter_key()
+            cached_results = dashboard_state.get_cached_results(filter_key)
+            
+            if cached_results is None:
+                # Recalculate results with filtered data
+                dict_distribution_summary = data_analyser.data_analyser.generate_distribution_summary(
+                    filtered_df, dashboard_state.comparison_mapping
+                )
+                dict_comparison_summary = data_analyser.data_analyser.generate_comparison_summary(
+                    filtered_df, dashboard_state.comparison_mapping
+                )
+                
+                # Generate breakdown analysis if breakdown columns are configured
+                breakdown_columns = data_analyser.config_loader.get_breakdown_columns()
+                breakdown_data = None
+                if breakdown_columns:
+                    breakdown_data = data_analyser.data_analyser.aggregate_impact_breakdown(
+                        filtered_df, dashboard_state.comparison_mapping, breakdown_columns
+                    )
+                
+                cached_results = (dict_distribution_summary, dict_comparison_summary, breakdown_data)
+                dashboard_state.cache_results(filter_key, cached_results)
+            
+            dict_distribution_summary, dict_comparison_summary, breakdown_data = cached_results
             
             # Update state with new results
             dashboard_state.set_results(dict_distribution_summary, dict_comparison_summary)
             
-            # Generate breakdown analysis if breakdown columns are configured
-            breakdown_columns = data_analyser.config_loader.get_breakdown_columns()
-            breakdown_data = None
-            if breakdown_columns:
-                breakdown_data = data_analyser.data_analyser.aggregate_impact_breakdown(
-                    filtered_df, dashboard_state.comparison_mapping, breakdown_columns
-                )
-            
             # Generate full HTML report using visualizer
             html_report_content = data_analyser.visualizer.generate_html_report(
                 dict_distribution_summary, dict_comparison_summary, breakdown_data
@@ -253,7 +276,7 @@ def register_callbacks(app):
         
         try:
             # Initialize data_analyser
-            data_analyser = ModularImpactAnalyzer(dashboard_state.config_path)
+            data_analyser = _get_analyzer(dashboard_state.config_path)
             
             # Generate output path with timestamp
             output_dir = data_analyser.config_loader.get_output_dir()
@@ -310,7 +333,7 @@ def register_callbacks(app):
             filtered_df = dashboard_state.get_filtered_data()
             
             # Initialize data_analyser
-            data_analyser = ModularImpactAnalyzer(dashboard_state.config_path)
+            data_analyser = _get_analyzer(dashboard_state.config_path)
             
             # Save output files (this will overwrite existing)
             data_analyser.save_output_files(
@@ -349,9 +372,8 @@ def register_callbacks(app):
             # Get steps from the first item (all items should have same steps)
             if dashboard_state.comparison_mapping:
                 first_item = list(dashboard_state.comparison_mapping.keys())[0]
-                step_dict = dashboard_state.comparison_mapping[first_item].get('differences', {})
                 step_options = []
-                for step_num in sorted(step_dict.keys()):
+                for step_num in dashboard_state.comparison_mapping[first_item].get('sorted_steps', []):
                     step_name = dashboard_state.comparison_mapping[first_item]['step_names'].get(step_num, f'Step {step_num}')
                     step_options.append({'label': step_name, 'value': step_num})
             else:
@@ -434,7 +456,7 @@ def register_callbacks(app):
         
         try:
             # Initialize data_analyser to get data_processor
-            data_analyser = ModularImpactAnalyzer(dashboard_state.config_path)
+            data_analyser = _get_analyzer(dashboard_state.config_path)
             
             # Get filtered data using the dashboard's current filtered data
             current_filtered_df = dashboard_state.get_filtered_data()
@@ -9,6 +9,7 @@ from typing import Dict, List
 import io
 import sys
 from collections import deque
+from itertools import islice
 import logging
 
 
@@ -31,9 +32,12 @@ class LogCapture:
         """Flush method for stdout compatibility"""
         self.original_stdout.flush()
         
-    def get_logs(self):
-        """Get all captured logs as a list"""
-        return list(self.logs)
+    def get_logs(self, last_n=None):
+        """Get captured logs as a list, optionally only the most recent last_n"""
+        if last_n is None:
+            return list(self.logs)
+        # Walk back from the newest entry instead of copying the whole buffer
+        return list(islice(reversed(self.logs), last_n))[::-1]
     
     def clear_logs(self):
         """Clear all captured logs"""
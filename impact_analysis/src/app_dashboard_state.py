@@ -4,10 +4,20 @@ Manages in-memory data storage to avoid reloading when applying filters
 """
 
 import pandas as pd
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
+import json
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Number of filter selections whose refresh results are kept
+RESULTS_CACHE_SIZE = 16
+
 
 class DashboardState:
     """Manages the state of the dashboard including data, config, and results"""
@@ -21,6 +31,7 @@ class DashboardState:
         self.config_path: Optional[str] = None
         self.filter_columns: List[str] = []
         self.active_filters: Dict[str, List] = {}
+        self._results_cache: OrderedDict = OrderedDict()
         
     def set_config(self, config_yaml: Dict, config_path: str):
         """Store configuration data"""
@@ -30,33 +41,71 @@ class DashboardState:
         self.filter_columns = config_yaml.get('filter', [])
         # Initialize active filters (all values selected by default)
         self.active_filters = {col: [] for col in self.filter_columns}
+        self._results_cache.clear()
     
     def set_data(self, merged_df: pd.DataFrame, comparison_mapping: Dict):
-        """Store merged data and comparison mapping"""
+        """Store merged data and comparison mapping
+        
+        String filter and breakdown columns are stored as categoricals, so the repeated
+        filtering and grouping on every refresh compare integer codes instead of strings.
+        """
+        segment_columns = list(self.filter_columns) + list((self.config_yaml or {}).get('breakdown', []) or [])
+        categorical_columns = {
+            col: 'category' for col in dict.fromkeys(segment_columns)
+            if col in merged_df.columns
+            and (merged_df[col].dtype == object or pd.api.types.is_string_dtype(merged_df[col].dtype))
+        }
+        if categorical_columns:
+            merged_df = merged_df.astype(categorical_columns)
         self.merged_df = merged_df
         self.comparison_mapping = comparison_mapping
+        self._results_cache.clear()
     
     def set_results(self, dict_distribution_summary: Dict, dict_comparison_summary: Dict):
         """Store analysis results"""
         self.dict_distribution_summary = dict_distribution_summary
         self.dict_comparison_summary = dict_comparison_summary
     
+    def get_filter_key(self) -> str:
+        """Key identifying the active filter selection, independent of column and value order"""
+        selection = {col: sorted(map(str, values)) for col, values in self.active_filters.items() if values}
+        return json.dumps(selection, sort_keys=True)
+    
+    def get_cached_results(self, filter_key: str) -> Optional[Tuple]:
+        """Get the results computed earlier for a filter selection, if still cached"""
+        results = self._results_cache.get(filter_key)
+        if results is not None:
+            self._results_cache.move_to_end(filter_key)
+        return results
+    
+    def cache_results(self, filter_key: str, results: Tuple):
+        """Cache the results for a filter selection, evicting the least recently used ones"""
+        self._results_cache[filter_key] = results
+        self._results_cache.move_to_end(filter_key)
+        while len(self._results_cache) > RESULTS_CACHE_SIZE:
+            self._results_cache.popitem(last=False)
+    
     def get_filtered_data(self) -> pd.DataFrame:
-        """Get filtered data based on active filters"""
+        """Get filtered data based on active filters
+        
+        The filters are combined into one row mask so only the selected rows are copied;
+        with no active filters the stored frame is returned as is and must not be modified.
+        """
         if self.merged_df is None:
             return None
         
-        filtered_df = self.merged_df.copy()
+        merged_df = self.merged_df
+        mask = None
         
         # Apply each active filter
         for col, values in self.active_filters.items():
-            if values and len(values) > 0 and col in filtered_df.columns:
+            if values and len(values) > 0 and col in merged_df.columns:
                 # Convert boolean columns to string for comparison
                 # This handles the case where Excel reads "True"/"False" as bool
-                if filtered_df[col].dtype == 'bool':
-                    col_for_comparison = filtered_df[col].astype(str)
+                if merged_df[col].dtype == 'bool':
+                    col_for_comparison = merged_df[col].astype(str)
                 else:
-                    col_for_comparison = filtered_df[col]
+                    col_for_comparison = merged_df[col]
                 
                 # Check if 'NA' is in the filter values
                 if 'NA' in values:
@@ -64,16 +113,19 @@ class DashboardState:
                     other_values = [v for v in values if v != 'NA']
                     if other_values:
                         # Include rows where column is NA OR matches other filter values
-                        mask = filtered_df[col].isna() | col_for_comparison.isin(other_values)
+                        col_mask = merged_df[col].isna() | col_for_comparison.isin(other_values)
                     else:
                         # Only NA is selected
-                        mask = filtered_df[col].isna()
-                    filtered_df = filtered_df[mask]
+                        col_mask = merged_df[col].isna()
                 else:
                     # Filter to include only selected values (exclude NA)
-                    filtered_df = filtered_df[col_for_comparison.isin(values)]
+                    col_mask = col_for_comparison.isin(values)
+                
+                mask = col_mask if mask is None else mask & col_mask
         
-        return filtered_df
+        if mask is None:
+            return merged_df
+        return merged_df[mask]
     
     def get_unique_values_for_filter(self, column: str) -> List:
         """Get unique values for a filter column from the merged data, including NA as a separate level"""
@@ -110,7 +162,7 @@ class DashboardState:
         """Get current configuration as YAML string for display/editing"""
         if self.config_yaml is None:
             return ""
-        return yaml.dump(self.config_yaml, default_flow_style=False, sort_keys=False)
+        return yaml.dump(self.config_yaml, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
     
     def update_config_from_yaml_string(self, yaml_string: str) -> tuple[bool, str]:
         """
@@ -118,7 +170,7 @@ class DashboardState:
         Returns: (success: bool, message: str)
         """
         try:
-            new_config = yaml.safe_load(yaml_string)
+            new_config = yaml.load(yaml_string, Loader=_YamlLoader)
             self.config_yaml = new_config
             
             # Update filter columns
@@ -127,6 +179,9 @@ class DashboardState:
             # Reset active filters for new columns
             self.active_filters = {col: [] for col in self.filter_columns}
             
+            # Bands and breakdown columns may have changed, so earlier results are stale
+            self._results_cache.clear()
+            
             return True, "Configuration updated successfully"
         except Exception as e:
             return False, f"Error parsing YAML: {str(e)}"
@@ -141,7 +196,7 @@ class DashboardState:
         
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(self.config_yaml, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(self.config_yaml, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
             return True, f"Configuration saved to {self.config_path}"
         except Exception as e:
             return False, f"Error saving configuration: {str(e)}"
@@ -28,9 +28,8 @@ class ImpactChartGenerator:
             return None
         
         try:
-            band_df = self.config_loader.load_band_data()
             # Return band names in the order they appear in the configuration
-            return band_df['Name'].tolist()
+            return self.config_loader.get_band_order()
         except Exception as e:
             logger.warning(f"Could not load band order from configuration: {e}")
             return None
@@ -4,12 +4,36 @@ Configuration loader for impact analysis tool
 
 import yaml
 import pandas as pd
+from functools import lru_cache
 from typing import Dict, Any, List
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML config file; cached per (path, mtime) so edits invalidate it"""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=8)
+def _read_mapping_sheet(file_path: str, sheet_name: str, mtime: float) -> pd.DataFrame:
+    """Read a mapping workbook sheet; cached per (path, sheet, mtime) so edits invalidate it"""
+    return pd.read_excel(file_path, sheet_name=sheet_name)
+
+
+def load_config_file(config_path: str) -> Dict[str, Any]:
+    """Load a YAML config file, reusing the parsed result until the file changes"""
+    return _parse_config_file(os.path.abspath(config_path), os.path.getmtime(config_path))
+
 
 class ConfigLoader:
     """Loads and validates configuration for impact analysis"""
@@ -25,8 +49,7 @@ class ConfigLoader:
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return load_config_file(self.config_path)
     
     def _abs_path(self, path: str) -> str:
         """Resolve relative paths relative to the config file directory"""
@@ -42,8 +65,9 @@ class ConfigLoader:
         sheet_name = mapping_config['sheet_input']
         
         try:
-            mapping_df = pd.read_excel(mapping_file_path, sheet_name=sheet_name)
-            return mapping_df
+            # Read by both the comparison mapping and the merge step, so parse it once per file version
+            mapping_df = _read_mapping_sheet(mapping_file_path, sheet_name, os.path.getmtime(mapping_file_path))
+            return mapping_df.copy()
         except Exception as e:
             raise ValueError(f"Failed to load mapping file: {e}")
     
@@ -54,11 +78,16 @@ class ConfigLoader:
         sheet_name = mapping_config['sheet_band']
         
         try:
-            band_df = pd.read_excel(mapping_file_path, sheet_name=sheet_name)
-            return band_df
+            # The band table is small and read for every step, so parse it once per file version
+            band_df = _read_mapping_sheet(mapping_file_path, sheet_name, os.path.getmtime(mapping_file_path))
+            return band_df.copy()
         except Exception as e:
             raise ValueError(f"Failed to load band data: {e}")
     
+    def get_band_order(self) -> List[str]:
+        """Get band names in the order they appear in the band sheet"""
+        return self.load_band_data()['Name'].tolist()
+    
     def is_renewal_enabled(self) -> bool:
         """Check if renewal feature is enabled in configuration
         
@@ -70,6 +99,13 @@ class ConfigLoader:
         except Exception:
             return False
     
+    def get_precision(self) -> str:
+        """Get the float precision for percentage difference columns ('float64' by default, or 'float32')"""
+        precision = self.config.get('features', {}).get('precision', 'float64')
+        if precision not in ('float64', 'float32'):
+            raise ValueError(f"Unsupported precision: {precision}")
+        return precision
+    
     def get_breakdown_columns(self) -> List[str]:
         """Get breakdown columns from configuration
         
@@ -88,3 +124,10 @@ class ConfigLoader:
     def get_output_dir(self) -> str:
         """Get output directory from configuration"""
         return self._abs_path(self.config['output']['dir'])
+    
+    def get_merged_data_format(self) -> str:
+        """Get the merged data output format ('csv' by default, or 'parquet')"""
+        merged_format = self.config.get('output', {}).get('merged_format', 'csv')
+        if merged_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported merged data format: {merged_format}")
+        return merged_format
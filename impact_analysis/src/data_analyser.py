@@ -2,8 +2,11 @@
 Analysis module for impact analysis tool using Pandas
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 
@@ -16,148 +19,146 @@ class DataAnalyser:
     def __init__(self, config_loader):
         self.config_loader = config_loader
     
-    def map_to_bands(self, merged_df: pd.DataFrame, value_col: str, band_df: pd.DataFrame) -> pd.DataFrame:
-        """Map differences to bands and count frequencies using Pandas"""
-        # Create band mapping function
-        # Use merge approach for better performance
-        merged_df = merged_df.copy()  # Create a copy to avoid modifying a slice
-        
-        # Create bins from band_df
-        bins = band_df['From'].dropna().tolist() + [float('inf')]
-        labels = band_df['Name'].dropna().tolist()
-        
-        # Map values to bands using pd.cut, handling missing values
-        merged_df['band'] = pd.cut(
-            merged_df[value_col],
-            bins=bins,
-            labels=labels,
-            right=False,
-            include_lowest=True
-        ).astype(str)
-        
-        # Replace 'nan' string with appropriate labels
-        # Use a mask to identify 'nan' entries and replace them appropriately
-        nan_mask = merged_df['band'] == 'nan'
-        merged_df.loc[nan_mask, 'band'] = merged_df.loc[nan_mask, value_col].apply(
-            lambda x: "Missing" if pd.isna(x) else "Out of Range"
-        )
+    def map_to_bands(self, merged_df: pd.DataFrame, value_col: str, band_df: pd.DataFrame,
+                     band_order: List[str] = None) -> pd.DataFrame:
+        """Map differences to bands and count frequencies using Pandas
+        
+        band_order defaults to the configured band order; callers mapping many
+        columns can pass it in to avoid re-reading the band sheet each time.
+        """
+        # Band edges: each band covers [From, next From), the last one is open-ended
+        bins = np.asarray(band_df['From'].dropna().tolist() + [np.inf], dtype='float64')
+        labels = [str(label) for label in band_df['Name'].dropna()]
+        if np.any(np.diff(bins) <= 0):
+            raise ValueError("bins must increase monotonically.")
+        if len(labels) != len(bins) - 1:
+            raise ValueError("Bin labels must be one fewer than the number of bin edges")
+        
+        # Locate every value's band with one binary search; below the first edge is "Out of Range".
+        # Float columns are scanned in their own dtype (e.g. float32) with the edges cast to match,
+        # so values stored at a band edge land in the same band as the edge
+        column = merged_df[value_col]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind == 'f':
+            values = column.to_numpy()
+            bins = bins.astype(values.dtype)
+        else:
+            values = column.to_numpy(dtype='float64', na_value=np.nan)
+        band_codes = np.searchsorted(bins, values, side='right') - 1
+        band_codes[(band_codes < 0) | (band_codes >= len(labels))] = len(labels) + 1
+        band_codes[np.isnan(values)] = len(labels)
+        
+        # Wrap the codes as an ordered categorical so counts come out in band order without sorting
+        bands = pd.Categorical.from_codes(band_codes, categories=labels + ['Missing', 'Out of Range'], ordered=True)
+        counts = pd.Series(bands).value_counts(sort=False)
+        counts = counts[counts > 0]
         
-        # Count frequencies by band using Pandas
         total_count = len(merged_df)
-        band_summary = merged_df.groupby('band').size().reset_index(name='Count')
-        band_summary['Percentage'] = (band_summary['Count'] / total_count * 100).round(2)
+        band_summary = pd.DataFrame({
+            'band': counts.index.astype(str),
+            'Count': counts.to_numpy(),
+            'Percentage': np.round(counts.to_numpy() / total_count * 100, 2)
+        })
         
         # Get the original band order from configuration
-        band_order = self.config_loader.load_band_data()['Name'].tolist()
-        
-        # Reorder band_summary to match the original band order
-        # Create a mapping from band name to row data
-        band_map = {row['band']: row for _, row in band_summary.iterrows()}
-        
-        # Create ordered list of ALL bands from configuration, including those with 0 count
-        ordered_bands = []
-        for band_name in band_order:
-            if band_name in band_map:
-                # Band has data, use existing row
-                ordered_bands.append(band_map[band_name])
-            else:
-                # Band has no data, create row with 0 count and 0% percentage
-                ordered_bands.append(pd.Series({
-                    'band': band_name,
-                    'Count': 0,
-                    'Percentage': 0.0
-                }))
-        
-        # Add any remaining bands that weren't in the original order but have data
-        for band_name in band_summary['band']:
-            if band_name not in band_order and band_name not in [b['band'] for b in ordered_bands]:
-                ordered_bands.append(band_map[band_name])
-        
-        # Convert back to DataFrame
-        band_summary_ordered = pd.DataFrame(ordered_bands)
+        if band_order is None:
+            band_order = self.config_loader.get_band_order()
+        
+        # Reorder band_summary to match the original band order, including bands with 0 count,
+        # followed by any remaining bands that have data but are not configured (Missing, Out of Range)
+        band_summary = band_summary.set_index('band')
+        extra_bands = band_summary.index.difference(band_order, sort=False).tolist()
+        band_summary_ordered = (
+            band_summary.reindex(band_order + extra_bands, fill_value=0)
+            .rename_axis('band')
+            .reset_index()
+        )
         
         return band_summary_ordered
     
+    def _band_chart_data(self, band_records: List[Dict]) -> List[Dict]:
+        """Package band summary records as chart points"""
+        return [
+            {'name': record['band'], 'y': int(record['Count']), 'percentage': round(record['Percentage'], 2)}
+            for record in band_records
+        ]
+    
+    def _summarize_item(self, merged_df: pd.DataFrame, item_name: str, item_data: Dict,
+                        band_df: pd.DataFrame, band_order: List[str]) -> Dict:
+        """Generate the band distributions for every step of one comparison item"""
+        logger.info("Assessing %s Impact...", item_name)
+        
+        # Initialize item analysis
+        item_summary = {
+            'steps': {},
+            'step_names': item_data['step_names'],
+            'renewal_enabled': item_data.get('renewal_enabled', False)
+        }
+        
+        # Process each difference column (step comparison)
+        if 'differences' in item_data:
+            # Steps are pre-sorted by the data processor so step 0 (Overall) comes first
+            for step_num in item_data['sorted_steps']:
+                diff_info = item_data['differences'][step_num]
+                diff_col = diff_info['percent_diff_column']
+                step_name = item_data['step_names'][step_num]
+                
+                # Band distribution for this step comparison (New Business)
+                summary_by_band = self.map_to_bands(merged_df, diff_col, band_df, band_order).to_dict('records')
+                
+                # Prepare chart data for this step comparison from the same records
+                step_chart_data = self._band_chart_data(summary_by_band)
+                
+                item_summary['steps'][step_num] = {
+                    'step_name': step_name,
+                    'percent_diff_column': diff_col,
+                    'chart_data': step_chart_data,
+                    'total_policies': len(merged_df),
+                    'summary_by_band': summary_by_band,
+                    'from_stage': diff_info['from_stage'],
+                    'to_stage': diff_info['to_stage']
+                }
+                
+                # If renewal is enabled, also calculate renewal distribution
+                if item_data.get('renewal_enabled', False) and 'renewal_differences' in item_data:
+                    if step_num in item_data['renewal_differences']:
+                        rn_diff_info = item_data['renewal_differences'][step_num]
+                        rn_diff_col = rn_diff_info['percent_diff_column']
+                        
+                        # Band distribution for renewal
+                        rn_summary_by_band = self.map_to_bands(merged_df, rn_diff_col, band_df, band_order).to_dict('records')
+                        
+                        # Prepare renewal chart data
+                        rn_step_chart_data = self._band_chart_data(rn_summary_by_band)
+                        
+                        # Store renewal data alongside main data
+                        item_summary['steps'][step_num]['renewal_chart_data'] = rn_step_chart_data
+                        item_summary['steps'][step_num]['renewal_summary_by_band'] = rn_summary_by_band
+                        item_summary['steps'][step_num]['renewal_percent_diff_column'] = rn_diff_col
+        
+        # Also store column information for summary calculations
+        item_summary['columns'] = item_data['columns']
+        
+        return item_summary
+    
     def generate_distribution_summary(self, merged_df: pd.DataFrame, comparison_mapping: Dict[str, Dict]) -> Dict:
         """Generate comprehensive analysis for multiple comparison items using Pandas
         
         If renewal feature is enabled, generates separate distributions for New Business and Renewal segments.
         """
+        # Load the band table and its order once for every item and step
         band_df = self.config_loader.load_band_data()
+        band_order = band_df['Name'].tolist()
         
         # Check if renewal is enabled
         is_renewal_enabled = any(item_data.get('renewal_enabled', False) for item_data in comparison_mapping.values())
         
-        # Process each comparison item
-        dict_distribution_summary = {}
-        
-        for item_name, item_data in comparison_mapping.items():
-            logger.info(f"Assessing {item_name} Impact...")
-            
-            # Initialize item analysis
-            dict_distribution_summary[item_name] = {
-                'steps': {},
-                'step_names': item_data['step_names'],
-                'renewal_enabled': item_data.get('renewal_enabled', False)
-            }
-            
-            # Process each difference column (step comparison)
-            if 'differences' in item_data:
-                # Sort steps to ensure step 0 (Overall) comes first
-                sorted_steps = sorted(item_data['differences'].keys())
-                
-                for step_num in sorted_steps:
-                    diff_info = item_data['differences'][step_num]
-                    diff_col = diff_info['percent_diff_column']
-                    step_name = item_data['step_names'][step_num]
-                    
-                    # Band distribution for this step comparison (New Business)
-                    summary_by_band = self.map_to_bands(merged_df, diff_col, band_df)
-                    
-                    # Prepare chart data for this step comparison
-                    step_chart_data = []
-                    for _, band_row in summary_by_band.iterrows():
-                        step_chart_data.append({
-                            'name': band_row['band'],
-                            'y': int(band_row['Count']),
-                            'percentage': round(band_row['Percentage'], 2)
-                        })
-                    
-                    dict_distribution_summary[item_name]['steps'][step_num] = {
-                        'step_name': step_name,
-                        'percent_diff_column': diff_col,
-                        'chart_data': step_chart_data,
-                        'total_policies': len(merged_df),
-                        'summary_by_band': summary_by_band.to_dict('records'),
-                        'from_stage': diff_info['from_stage'],
-                        'to_stage': diff_info['to_stage']
-                    }
-                    
-                    # If renewal is enabled, also calculate renewal distribution
-                    if item_data.get('renewal_enabled', False) and 'renewal_differences' in item_data:
-                        if step_num in item_data['renewal_differences']:
-                            rn_diff_info = item_data['renewal_differences'][step_num]
-                            rn_diff_col = rn_diff_info['percent_diff_column']
-                            
-                            # Band distribution for renewal
-                            rn_summary_by_band = self.map_to_bands(merged_df, rn_diff_col, band_df)
-                            
-                            # Prepare renewal chart data
-                            rn_step_chart_data = []
-                            for _, band_row in rn_summary_by_band.iterrows():
-                                rn_step_chart_data.append({
-                                    'name': band_row['band'],
-                                    'y': int(band_row['Count']),
-                                    'percentage': round(band_row['Percentage'], 2)
-                                })
-                            
-                            # Store renewal data alongside main data
-                            dict_distribution_summary[item_name]['steps'][step_num]['renewal_chart_data'] = rn_step_chart_data
-                            dict_distribution_summary[item_name]['steps'][step_num]['renewal_summary_by_band'] = rn_summary_by_band.to_dict('records')
-                            dict_distribution_summary[item_name]['steps'][step_num]['renewal_percent_diff_column'] = rn_diff_col
-            
-            # Also store column information for summary calculations
-            dict_distribution_summary[item_name]['columns'] = item_data['columns']
+        # Items are independent, so summarize them in parallel using ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, min(len(comparison_mapping), os.cpu_count() or 4))) as executor:
+            item_summaries = executor.map(
+                lambda item: self._summarize_item(merged_df, item[0], item[1], band_df, band_order),
+                comparison_mapping.items()
+            )
+            dict_distribution_summary = dict(zip(comparison_mapping, item_summaries))
         
         return dict_distribution_summary
 
@@ -168,8 +169,7 @@ class DataAnalyser:
         This method:
         1. Extracts all renamed columns from comparison_mapping for each item and stage
         2. Aggregates merged_df by summing all rows for each stage column
-        3. Creates a single-row summary DataFrame with column totals
-        4. Calls generate_differences to compute difference columns and percentage differences
+        3. Looks up each stage total and its difference from the previous stage
         
         Args:
             merged_df: The merged dataframe containing all data rows
@@ -189,8 +189,8 @@ class DataAnalyser:
             for stage in item_stages:
                 renamed_columns.append(item_stages[stage]['renamed_column'])
 
-        # aggregate merged_df by summing all rows for each stage column
-        summary_data = pd.DataFrame([merged_df[renamed_columns].sum()])
+        # aggregate merged_df by summing all rows for each stage column in one pass
+        column_totals = merged_df[renamed_columns].sum()
 
         # convert the df into dict for easier manipulation
         dict_comparison_summary = {}
@@ -199,12 +199,12 @@ class DataAnalyser:
             
             dict_comparison_summary[item_name] = {}
             sorted_stages = sorted(item_dict['stages'].keys())
-            value_total_first_stage = summary_data[item_dict['columns'][sorted_stages[0]]].sum()
+            value_total_first_stage = column_totals[item_dict['columns'][sorted_stages[0]]]
             
             for idx, stage in enumerate(sorted_stages):
                 stage_name = item_dict['stage_names'][stage]
                 col_name = item_dict['columns'][stage]
-                value_total = summary_data[col_name].sum()
+                value_total = column_totals[col_name]
                 value_total_percent = value_total / value_total_first_stage
                 
                 # Calculate the difference for this stage
@@ -214,7 +214,7 @@ class DataAnalyser:
                 else:
                     prev_stage = sorted_stages[idx - 1]
                     prev_col_name = item_dict['columns'][prev_stage]
-                    value_diff = value_total - summary_data[prev_col_name].sum()
+                    value_diff = value_total - column_totals[prev_col_name]
                     value_diff_percent = value_diff / value_total_first_stage
 
                 dict_comparison_summary[item_name][idx] = {
@@ -260,7 +260,7 @@ class DataAnalyser:
             if segment_type == 'rn':
                 # Check if renewal columns exist
                 if 'renewal_columns' not in item_dict:
-                    logger.warning(f"Renewal columns not found for item '{item_name}'. Skipping.")
+                    logger.warning("Renewal columns not found for item '%s'. Skipping.", item_name)
                     continue
                 columns_dict = item_dict['renewal_columns']
             else:
@@ -283,7 +283,7 @@ class DataAnalyser:
                 if renamed_col in merged_df.columns:
                     row_data[stage_name] = merged_df[renamed_col].sum()
                 else:
-                    logger.warning(f"Column '{renamed_col}' not found in merged_df for item '{item_name}', stage '{stage_name}'")
+                    logger.warning("Column '%s' not found in merged_df for item '%s', stage '%s'", renamed_col, item_name, stage_name)
                     row_data[stage_name] = 0
             
             summary_rows.append(row_data)
@@ -323,7 +323,7 @@ class DataAnalyser:
         """
         # Validate breakdown columns length
         if len(breakdown_columns) > 3:
-            logger.warning(f"Maximum 3 breakdown columns allowed. Truncating from {len(breakdown_columns)} to 3.")
+            logger.warning("Maximum 3 breakdown columns allowed. Truncating from %d to 3.", len(breakdown_columns))
             breakdown_columns = breakdown_columns[:3]
         
         if len(breakdown_columns) == 0:
@@ -334,7 +334,7 @@ class DataAnalyser:
         valid_breakdown_columns = [col for col in breakdown_columns if col in merged_df.columns]
         if len(valid_breakdown_columns) < len(breakdown_columns):
             missing_cols = set(breakdown_columns) - set(valid_breakdown_columns)
-            logger.warning(f"Columns {missing_cols} not found in data. Using only: {valid_breakdown_columns}")
+            logger.warning("Columns %s not found in data. Using only: %s", missing_cols, valid_breakdown_columns)
             breakdown_columns = valid_breakdown_columns
         
         if len(breakdown_columns) == 0:
@@ -343,6 +343,10 @@ class DataAnalyser:
         
         breakdown_results = {}
         
+        # Group keys and policy counts are the same for every item, so compute them once
+        grouped_by_breakdown = merged_df.groupby(breakdown_columns, dropna=False, observed=True)
+        policy_count = grouped_by_breakdown.size()
+        
         for item_name, item_dict in comparison_mapping.items():
             # Get first and last stage columns
             sorted_stages = sorted(item_dict['stages'].keys())
@@ -354,7 +358,7 @@ class DataAnalyser:
             
             # Check if columns exist in the dataframe
             if first_stage_col not in merged_df.columns or last_stage_col not in merged_df.columns:
-                logger.warning(f"Columns {first_stage_col} or {last_stage_col} not found for {item_name}. Skipping.")
+                logger.warning("Columns %s or %s not found for %s. Skipping.", first_stage_col, last_stage_col, item_name)
                 continue
             
             # Group by breakdown columns and calculate aggregates
@@ -363,8 +367,8 @@ class DataAnalyser:
                 last_stage_col: 'sum'
             }
             
-            grouped = merged_df.groupby(breakdown_columns, dropna=False).agg(agg_dict)
-            grouped['policy_count'] = merged_df.groupby(breakdown_columns, dropna=False).size()
+            grouped = grouped_by_breakdown.agg(agg_dict)
+            grouped['policy_count'] = policy_count
             grouped = grouped.reset_index()
             
             # Rename columns for clarity
@@ -375,10 +379,10 @@ class DataAnalyser:
             
             # Calculate differences
             grouped['value_diff'] = grouped['value_total_end'] - grouped['value_total_start']
-            grouped['value_diff_percent'] = grouped.apply(
-                lambda row: (row['value_diff'] / row['value_total_start'] * 100) if row['value_total_start'] != 0 else 0,
-                axis=1
-            )
+            # Percentage change per group, 0 where the starting total is 0 (vectorized instead of a row-wise apply)
+            grouped['value_diff_percent'] = (
+                grouped['value_diff'] / grouped['value_total_start'] * 100
+            ).where(grouped['value_total_start'] != 0, 0)
             
             # Sort by breakdown columns
             grouped = grouped.sort_values(by=breakdown_columns).reset_index(drop=True)
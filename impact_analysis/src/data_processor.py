@@ -44,11 +44,11 @@ class DataProcessor:
         """Load file and keep only first row for each ID value using Pandas"""
         try:
             df = pd.read_excel(file_path, engine='calamine')
-            logger.info(f"Loaded {len(df)} rows from {file_path}")
+            logger.info("Loaded %d rows from %s", len(df), file_path)
             
             # Keep only first row for each ID value using Pandas
             df_deduped = df.drop_duplicates(subset=[id_column], keep='first')
-            logger.info(f"After deduplication: {len(df_deduped)} rows")
+            logger.info("After deduplication: %d rows", len(df_deduped))
             
             return df_deduped
         except Exception as e:
@@ -67,7 +67,7 @@ class DataProcessor:
             raise ValueError("No mapping data found")
         
         logger.info("Mapping data loaded:")
-        logger.info(f"\n{mapping_df[['Item', 'Stage', 'StageName', 'File', 'Column']].head(10)}")
+        logger.info("\n%s", mapping_df[['Item', 'Stage', 'StageName', 'File', 'Column']].head(10))
         
         # Get full file paths
         mapping_df['File'] = mapping_df['File'].apply(self.config_loader._abs_path)
@@ -143,7 +143,7 @@ class DataProcessor:
         # Load mapping data to get ID column
         mapping_df = self.config_loader.load_mapping_data()
         id_column = mapping_df.iloc[0]['ID']
-        logger.info(f"ID Column: {id_column}")
+        logger.info("ID Column: %s", id_column)
         
         # Get full file paths
         mapping_df['File'] = mapping_df['File'].apply(self.config_loader._abs_path)
@@ -156,7 +156,7 @@ class DataProcessor:
         unique_file_paths = mapping_df['File'].unique()
         
         # Load and deduplicate all files in parallel using ThreadPoolExecutor
-        logger.info(f"Loading {len(unique_file_paths)} files in parallel...")
+        logger.info("Loading %d files in parallel...", len(unique_file_paths))
         with ThreadPoolExecutor(max_workers=min(len(unique_file_paths), os.cpu_count() or 4)) as executor:
             # Submit all file loading tasks
             future_to_filepath = {
@@ -170,10 +170,10 @@ class DataProcessor:
                 try:
                     dict_data[file_path] = future.result()
                 except Exception as e:
-                    print(f"Error loading {file_path}: {e}")
+                    logger.error("Error loading %s: %s", file_path, e)
                     raise
         
-        logger.info(f"All {len(unique_file_paths)} files loaded successfully")
+        logger.info("All %d files loaded successfully", len(unique_file_paths))
         
         # Get all items
         impact_items = list(comparison_mapping.keys())
@@ -185,7 +185,7 @@ class DataProcessor:
         
         # Start with all columns from first file
         merged_df = dict_data[first_file].copy()
-        logger.info(f"Starting with all columns from first file")
+        logger.info("Starting with all columns from first file")
         
         # Rename comparison columns in the base dataframe
         first_file_rename_map = {}
@@ -245,8 +245,8 @@ class DataProcessor:
                         temp_df = temp_df.rename(columns={orig_col: new_col})
                         merged_df = merged_df.merge(temp_df, on=id_column, how='inner')
 
-        logger.info(f"Merged data: {len(merged_df)} rows")
-        logger.info(f"Merged columns: {list(merged_df.columns)}")
+        logger.info("Merged data: %d rows", len(merged_df))
+        logger.info("Merged columns: %s", list(merged_df.columns))
         
         # Clean the merged data: convert blank strings to NA
         merged_df = self.clean_data(merged_df)
@@ -410,11 +410,21 @@ class DataProcessor:
                         }
         
             comparison_mapping[item]['step_names'] = dict_step_names
+            
+            # Sort the steps once here (step 0, Overall, first) instead of in every summary call
+            comparison_mapping[item]['sorted_steps'] = sorted(comparison_mapping[item]['differences'].keys())
+        
+        diff_df = pd.DataFrame(new_columns, index=merged_df.index)
+        
+        # Optionally halve the memory scanned when banding by storing percentages as float32
+        if self.config_loader.get_precision() == 'float32':
+            percent_cols = [col for col in diff_df.columns if col.startswith('percent_diff_')]
+            diff_df[percent_cols] = diff_df[percent_cols].astype('float32')
         
         # Add all new columns at once to avoid fragmentation
-        merged_df_w_diff = pd.concat([merged_df, pd.DataFrame(new_columns, index=merged_df.index)], axis=1)
+        merged_df_w_diff = pd.concat([merged_df, diff_df], axis=1)
 
-        logger.info(f"Difference info generated")
+        logger.info("Difference info generated")
 
         return merged_df_w_diff, comparison_mapping
     
@@ -508,6 +518,7 @@ class DataProcessor:
             (merged_df[diff_col] <= to_threshold)
         ].copy()
         
-        logger.info(f"Filtered data for {item_name} ({segment_type.upper()}), step {step_num}: {len(filtered_df)} rows (from {from_threshold} to {to_threshold})")
+        logger.info("Filtered data for %s (%s), step %s: %d rows (from %s to %s)",
+                    item_name, segment_type.upper(), step_num, len(filtered_df), from_threshold, to_threshold)
         
         return filtered_df
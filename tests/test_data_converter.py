@@ -0,0 +1,27 @@
+"""
+Tests for the converter data type validation
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from converter.src.data_converter import DataConverter
+
+
+def test_code_column_accepts_unicode_uppercase_next_to_missing_values():
+    col_data = pd.Series(['ZÜRICH', np.nan, 'AB 1'])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = DataConverter(None)._validate_code_vectorized(col_data)
+
+    assert result.iloc[[0, 2]].tolist() == ['ZÜRICH', 'AB 1']
+    assert pd.isna(result.iloc[1])
+
+
+def test_code_column_rejects_lowercase_after_unicode_uppercase():
+    with pytest.raises(ValueError, match="uppercase letters and numbers: 'Zürich'"):
+        DataConverter(None)._validate_code_vectorized(pd.Series(['ZÜRICH', np.nan, 'Zürich']))
@@ -0,0 +1,20 @@
+"""
+Tests for the converter data loader
+"""
+
+import pandas as pd
+
+from converter.src.data_converter import DataConverter
+from converter.src.data_loader import DataLoader
+
+
+def test_csv_date_column_keeps_blank_cells_missing(tmp_path):
+    input_path = tmp_path / 'input.csv'
+    input_path.write_text('policy_id,inception_date\nP1,2024-01-05\nP2,\nP3,2024-03-01\n')
+
+    df = DataLoader(None).load_input_data(str(input_path))
+
+    assert df['inception_date'].isna().tolist() == [False, True, False]
+    converted = DataConverter(None)._convert_date_vectorized(df['inception_date'])
+    assert converted.iloc[[0, 2]].tolist() == ['05/01/2024', '01/03/2024']
+    assert pd.isna(converted.iloc[1])
@@ -0,0 +1,20 @@
+"""
+Tests for the converter output generator
+"""
+
+import pandas as pd
+
+from converter.src.output_generator import OutputGenerator
+
+
+def test_save_excel_keeps_every_cell(tmp_path):
+    df = pd.DataFrame({
+        'POLICY_ID': ['P1', 'P2', 'P3', 'P4'],
+        'PREMIUM': [100.5, 200.0, 300.25, 400.0],
+        'REGION': ['NORTH', 'SOUTH', 'EAST', 'WEST'],
+    })
+    output_path = tmp_path / 'output.xlsx'
+
+    OutputGenerator(None).save_output_data(df, str(output_path), 'excel')
+
+    pd.testing.assert_frame_equal(pd.read_excel(output_path, engine='openpyxl'), df)